@@ -1,9 +1,10 @@
 # -*- coding: utf-8 -*-
 import maya.cmds as cmds
-import json
 import os
+from collections import defaultdict
 from core import udim_sampler
 from core import shader_assigner
+from core import utils
 
 def ProcessAndSampleMissingData(json_path):
     """
@@ -18,56 +19,71 @@ def ProcessAndSampleMissingData(json_path):
         cmds.error("JSON file not found: {}".format(json_path))
         return
 
-    # Load the JSON data
-    with open(json_path, 'r') as f:
-        data = json.load(f)
+    # One undo chunk, evaluation and refresh paused for the whole run
+    with utils.bulk_edit():
+        # First pass: queue sampled meshes, resolve the rest to a texture path or flat color
+        assignments         = defaultdict(list)
+        pending_shaders     = []    # (scene_obj, shader)
+        pending_textures    = []    # (scene_obj, texture_path)
+        flat_colors         = []    # (scene_obj, rgb)
+        assigner._build_scene_index()
 
-    meshes = data.get("meshes", [])
-    
-    for mesh_entry in meshes:
-        object_path = mesh_entry.get("object")
-        uv_sets = mesh_entry.get("uv_sets", [])
-        
-        # Determine if any UV set has valid samples
-        has_valid_samples = False
-        for uv in uv_sets:
-            if uv.get("samples"): # Checks if list is not None or empty
-                has_valid_samples = True
-                break
+        # Stream mesh entries from the JSON
+        for mesh_entry in utils.iter_json_meshes(json_path):
+            object_path = mesh_entry.get("object")
+            uv_sets = mesh_entry.get("uv_sets", [])
         
-        # ---------------------------------------------------------
-        # Logic: If samples are null, get Dominant Color from Object
-        # ---------------------------------------------------------
-        if not has_valid_samples:
-            print("Samples null for {}. Triggering Dominant Color Sampler...".format(object_path))
+            # If samples existed, assign from the already-parsed entry.
+            # Black or unusable samples fall through to the dominant color,
+            # objects that are not in the scene (None) are skipped.
+            needs_sample = not any(uv.get("samples") for uv in uv_sets)
+            if not needs_sample and assigner._assign_one_mesh(mesh_entry, assignments) is False:
+                needs_sample = True
+
+            # ---------------------------------------------------------
+            # Logic: If samples are null, get Dominant Color from Object
+            # ---------------------------------------------------------
+            if needs_sample:
+                print("Samples null for {}. Triggering Dominant Color Sampler...".format(object_path))
             
-            # Find the object in the scene using your existing search logic
-            scene_obj = assigner.find_object_in_scene(object_path)
+                # Find the object in the scene using your existing search logic
+                scene_obj = assigner.find_object_in_scene(object_path)
             
-            if scene_obj and cmds.objExists(scene_obj):
-                # Get the shader and texture info
-                shader = sampler.get_shader_from_shape(scene_obj)
-                if shader:
-                    tex_info = sampler.get_file_texture_or_color_from_shader(shader)
-                    
-                    dominant_rgb = None
-                    if tex_info and tex_info["type"] == "file":
-                        path = sampler.get_texture_file_path(tex_info["value"])
-                        if path and os.path.exists(path):
-                            dominant_rgb = sampler.get_dominant_color(path)
-                    
-                    elif tex_info and tex_info["type"] == "color":
-                        dominant_rgb = tuple(tex_info["value"])
+                if scene_obj and cmds.objExists(scene_obj):
+                    # Get the shader, texture info is resolved below once all shaders are known
+                    shader = sampler.get_shader_from_shape(scene_obj)
+                    if shader:
+                        pending_shaders.append((scene_obj, shader))
+                else:
+                    print("Skipping: Object {} not found in scene.".format(object_path))
+
+        # Resolve all file texture paths in one batch
+        sampler.prefetch_texture_paths([shader for _, shader in pending_shaders])
+
+        for scene_obj, shader in pending_shaders:
+            tex_info = sampler.get_file_texture_or_color_from_shader(shader)
+
+            if tex_info and tex_info["type"] == "file":
+                path = sampler.get_texture_file_path(tex_info["value"])
+                if path and os.path.exists(path):
+                    pending_textures.append((scene_obj, path))
+
+            elif tex_info and tex_info["type"] == "color":
+                flat_colors.append((scene_obj, tuple(tex_info["value"])))
+
+        # Second pass: decode textures in parallel, no Maya calls
+        texture_colors = sampler.get_dominant_colors([path for _, path in pending_textures])
+
+        # Third pass: assign shaders on the main thread
+        resolved = flat_colors + [(obj, texture_colors.get(path)) for obj, path in pending_textures]
+        for scene_obj, dominant_rgb in resolved:
+            if dominant_rgb:
+                sg = assigner.get_or_create_shader_for_color(dominant_rgb)
+                if sg:
+                    assignments[sg].append(scene_obj)
+                    print("Successfully applied dominant color to {}".format(scene_obj))
 
-                    # If a color was found, assign the shader
-                    if dominant_rgb:
-                        sg = assigner.get_or_create_shader_for_color(dominant_rgb)
-                        assigner.assign_shader_to_object(scene_obj, sg)
-                        print("Successfully applied dominant color to {}".format(scene_obj))
-            else:
-                print("Skipping: Object {} not found in scene.".format(object_path))
-        else:
-            # If samples existed, proceed with standard assignment
-            assigner.process_json_and_assign_shaders(json_path)
+        utils.assign_shading_groups(assignments)
+        assigner.invalidate_scene_index()
 
     cmds.inViewMessage(amg='<hl>Processing Complete</hl>', pos='topCenter', fade=True)
@@ -1,21 +1,24 @@
 # -*- coding: utf-8 -*-
 import maya.cmds as cmds
 import os
-import json
+from collections import defaultdict
 import udim_sampler
 import shader_assigner
+from core import utils
 
 # Reloading to ensure latest logic is used
 # reload(udim_sampler)
 # reload(shader_assigner)
 
-def get_selected_dominant_colors():
+def get_selected_dominant_colors(sampler=None):
     """
     Analyzes selected objects, finds their textures, and returns a dictionary 
     mapping each object to its dominant RGB color.
+    Pass `sampler` to reuse its lookup caches across calls.
     """
     # 1. Initialize core classes
-    sampler = udim_sampler.UDIMSampler()
+    if sampler is None:
+        sampler = udim_sampler.UDIMSampler()
     
     # 2. Get current selection (long names to avoid ambiguity)
     selection = cmds.ls(selection=True, long=True)
@@ -23,56 +26,153 @@ def get_selected_dominant_colors():
         cmds.warning("Please select at least one mesh.")
         return {}
 
-    results = {}
+    # 3. Resolve one mesh shape per selected object (batched, not per object)
+    shapes      = cmds.listRelatives(selection, shapes=True, fullPath=True, noIntermediate=True) or []
+    mesh_shapes = set(cmds.ls(shapes + selection, type="mesh", long=True) or [])
 
+    obj_to_shape = {}
+    for shape in shapes:
+        if shape in mesh_shapes:
+            obj_to_shape.setdefault(shape.rsplit("|", 1)[0], shape)
     for obj in selection:
-        # Ensure we are working with the shape node
-        shapes = cmds.listRelatives(obj, shapes=True, fullPath=True) or [obj]
-        shape = shapes[0]
-        
-        if cmds.nodeType(shape) != "mesh":
+        if obj in mesh_shapes:
+            obj_to_shape.setdefault(obj, obj)
+
+    # 4. Shape -> shading group in one listConnections call, shading group -> shader once per group
+    shape_to_sg  = _get_shading_groups(list(set(obj_to_shape.values())))
+    sg_to_shader = {}
+    for sg in set(shape_to_sg.values()):
+        shaders = cmds.ls(cmds.listConnections(sg) or [], materials=True) or []
+        sg_to_shader[sg] = shaders[0] if shaders else None
+
+    # 5. Resolve each unique shader to a texture path or flat color (Maya reads, main thread)
+    sampler.prefetch_texture_paths(sg_to_shader.values())
+    obj_to_shader  = {}
+    shader_sources = {}
+    for obj in selection:
+        shape = obj_to_shape.get(obj)
+        if not shape:
             continue
 
-        # 3. Get shader and texture information
-        shader = sampler.get_shader_from_shape(shape)
+        shader = sg_to_shader.get(shape_to_sg.get(shape))
         if not shader:
             print("No shader found for: {}".format(obj))
             continue
 
-        shader_info = sampler.get_file_texture_or_color_from_shader(shader)
-        if not shader_info:
-            continue
+        obj_to_shader[obj] = shader
+        if shader not in shader_sources:
+            shader_sources[shader] = _get_shader_color_source(shader, sampler, obj)
 
-        dominant_rgb = None
-
-        # 4. Handle File Textures vs. Flat Colors
-        if shader_info["type"] == "file":
-            texture_node = shader_info["value"]
-            texture_path = sampler.get_texture_file_path(texture_node)
-            
-            if texture_path and os.path.exists(texture_path):
-                # Extract color from the image
-                dominant_rgb = sampler.get_dominant_color(texture_path)
-            else:
-                print("Texture path not found for {}: {}".format(obj, texture_path))
-        
-        elif shader_info["type"] == "color":
-            # Already a flat color
-            dominant_rgb = tuple(shader_info["value"])
+    # 6. Decode all textures in parallel, then map colors back to objects
+    texture_colors = sampler.get_dominant_colors(
+        [value for kind, value in filter(None, shader_sources.values()) if kind == "file"])
 
+    results = {}
+    for obj in selection:
+        source = shader_sources.get(obj_to_shader.get(obj))
+        if not source:
+            continue
+
+        kind, value  = source
+        dominant_rgb = texture_colors.get(value) if kind == "file" else value
         if dominant_rgb:
             results[obj] = dominant_rgb
             print("Object: {} | Dominant Color: {}".format(obj, dominant_rgb))
 
     return results
 
-def apply_dominant_color_as_shader():
+def _get_shading_groups(shapes):
+    """
+    Map each shape (long name) to its first shading group with a single
+    listConnections call.
+    """
+    if not shapes:
+        return {}
+
+    # Maya reports plugs with the shortest unique name, so index every partial path
+    name_to_shape = {}
+    for shape in shapes:
+        parts = shape.lstrip("|").split("|")
+        for i in range(len(parts)):
+            name_to_shape["|".join(parts[i:])] = shape
+        name_to_shape[shape] = shape
+
+    conns = cmds.listConnections(shapes, type="shadingEngine", connections=True) or []
+    shape_to_sg = {}
+    for plug, sg in zip(conns[::2], conns[1::2]):
+        shape = name_to_shape.get(plug.split(".")[0])
+        if shape:
+            shape_to_sg.setdefault(shape, sg)
+    return shape_to_sg
+
+def get_dominant_color_for_object(obj, sampler):
+    """
+    Return the dominant RGB color of the texture (or flat color) on an object's
+    shader, or None if it cannot be resolved.
+    """
+    # Ensure we are working with the shape node
+    shapes = cmds.listRelatives(obj, shapes=True, fullPath=True) or [obj]
+    shape = shapes[0]
+
+    if cmds.nodeType(shape) != "mesh":
+        return None
+
+    # Get shader and texture information
+    shader = sampler.get_shader_from_shape(shape)
+    if not shader:
+        print("No shader found for: {}".format(obj))
+        return None
+
+    return get_dominant_color_for_shader(shader, sampler, obj)
+
+def get_dominant_color_for_shader(shader, sampler, obj=None):
+    """
+    Return the dominant RGB color of a shader's file texture or flat color,
+    or None if it cannot be resolved. `obj` is only used for log messages.
+    """
+    source = _get_shader_color_source(shader, sampler, obj)
+    if not source:
+        return None
+
+    kind, value = source
+    if kind == "file":
+        # Extract color from the image
+        return sampler.get_dominant_color(value)
+    return value
+
+def _get_shader_color_source(shader, sampler, obj=None):
+    """
+    Return ("file", texture_path) or ("color", rgb) for a shader, or None.
+    Only queries Maya, so the texture decode can be done separately.
+    """
+    shader_info = sampler.get_file_texture_or_color_from_shader(shader)
+    if not shader_info:
+        return None
+
+    # Handle File Textures vs. Flat Colors
+    if shader_info["type"] == "file":
+        texture_node = shader_info["value"]
+        texture_path = sampler.get_texture_file_path(texture_node)
+
+        if texture_path and os.path.exists(texture_path):
+            return ("file", texture_path)
+        print("Texture path not found for {}: {}".format(obj or shader, texture_path))
+
+    elif shader_info["type"] == "color":
+        # Already a flat color
+        return ("color", tuple(shader_info["value"]))
+
+    return None
+
+def apply_dominant_color_as_shader(assigner=None, sampler=None):
     """
     Utility function to sample selection and immediately assign a 
     new placeholder shader based on the dominant color.
+    Pass `assigner` / `sampler` to share their shader and lookup caches across calls.
     """
-    color_data = get_selected_dominant_colors()
-    assigner = shader_assigner.ShaderAssigner()
+    color_data = get_selected_dominant_colors(sampler)
+    if assigner is None:
+        assigner = shader_assigner.ShaderAssigner()
 
     for obj, rgb in color_data.items():
         # Get or create a lambert with this color
@@ -88,46 +188,52 @@ def apply_dominant_color_as_shader():
 # Reads JSON data. If 'samples' are null/empty, it uses the
 # Dominant Color Sampler to find the color and assign a shader.
 # ---------------------------------------------------------------------------------------------------
-def assign_select_object(json_path):
+def assign_select_object(json_path, assigner=None, sampler=None):
     """
     Reads JSON data. If 'samples' is null/empty, it uses the
     Dominant Color Sampler to find the color and assign a shader.
+    Pass the caller's assigner / sampler to reuse their shader and lookup caches.
     """
 
     if not os.path.exists(json_path):
         cmds.error("JSON file not found: {}".format(json_path))
         return
 
-    # Load the JSON data
-    with open(json_path, 'r') as f:
-        data = json.load(f)
-
-    meshes = data.get("meshes", [])
-
-    for mesh_entry in meshes:
-        object_path = mesh_entry.get("object")
-        uv_sets     = mesh_entry.get("uv_sets", [])
-
-        for uv in uv_sets:
-            if not uv.get("samples"):
-                if cmds.objExists(object_path):
-                    cmds.select(object_path, replace=True)
-                    apply_dominant_color_as_shader()
-                else:
-                    print("Skipping: Object {} not found in scene.".format(object_path))
-
-            if uv.get("samples"):
-                samples = uv.get("samples", [])
-                if samples:
-                    color = samples[0].get("color")
-                    if color == [0,0,0]:
-                        if cmds.objExists(object_path):
-                            cmds.select(object_path, replace=True)
-                            apply_dominant_color_as_shader()
-                        else:
-                            print("Skipping: Object {} not found in scene.".format(object_path))
-
-
-
-
-
+    # One sampler / assigner for the whole file so their caches are shared
+    sampler     = sampler or udim_sampler.UDIMSampler()
+    assigner    = assigner or shader_assigner.ShaderAssigner()
+    assignments = defaultdict(list)
+
+    with utils.bulk_edit():
+        # Stream mesh entries from the JSON
+        for mesh_entry in utils.iter_json_meshes(json_path):
+            object_path = mesh_entry.get("object")
+            uv_sets     = mesh_entry.get("uv_sets", [])
+
+            # A mesh needs the dominant color if any UV set has no samples or a black first sample
+            needs_dominant = False
+            for uv in uv_sets:
+                samples = uv.get("samples")
+                if not samples or samples[0].get("color") == [0,0,0]:
+                    needs_dominant = True
+                    break
+
+            if not needs_dominant:
+                continue
+
+            # Exact path only, a short name match could land on a mesh of another reference
+            if not cmds.objExists(object_path):
+                print("Skipping: Object {} not found in scene.".format(object_path))
+                continue
+            scene_obj = object_path
+
+            # Sample the object directly instead of going through the selection
+            rgb = get_dominant_color_for_object(scene_obj, sampler)
+            if not rgb:
+                continue
+
+            sg = assigner.get_or_create_shader_for_color(rgb, tolerance=2)
+            if sg:
+                assignments[sg].append(scene_obj)
+
+        utils.assign_shading_groups(assignments)
@@ -7,54 +7,121 @@ import re
 import maya.cmds as cmds
 import json
 import os
+from collections import defaultdict
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 import selected_color_sampler
-reload(selected_color_sampler)
+from core import utils
+
+if utils.DEV_MODE:
+    reload(selected_color_sampler)
 
 #================================================================================================================================
 # ShaderAssigner Class
 #================================================================================================================================
 class ShaderAssigner(object):
+    # Bin size of the color cache, lookups with a tolerance up to this only check neighbouring bins
+    COLOR_BIN_SIZE = 2
+
     def __init__(self):
         # Cache shaders by color tuple
         self.shader_cache = {}
+        # Quantized color bin -> [(color, sg)], used for O(1) tolerance lookups
+        self._bin_cache = defaultdict(list)
+        # Cached colors for larger tolerances, same order as _cached_sgs. The first len(_cached_sgs)
+        # rows are filled, capacity doubles when full so inserts stay amortized O(1)
+        self._cached_arr = np.empty((64, 3), dtype=np.int16) if np is not None else None
+        self._cached_sgs = []
+        # short name -> [transform paths], built once per JSON run
+        self._scene_index = None
 
     def load_json_data(self, json_path):
         if not os.path.exists(json_path):
             print("JSON file not found:", json_path)
             return None
         try:
-            with open(json_path, "r") as f:
-                data = json.load(f)
+            data = utils.load_json_file(json_path)
             print("Loaded JSON data from:", json_path)
             return data
         except Exception as e:
             print("Failed to load JSON: {}".format(e))
             return None
 
+    # ---------------------------------------------------------------------------------------------------------------------------
+    # Stream mesh entries from the JSON one at a time instead of loading the whole file
+    # ---------------------------------------------------------------------------------------------------------------------------
+    def iter_json_meshes(self, json_path):
+        if not os.path.exists(json_path):
+            print("JSON file not found:", json_path)
+            return
+        try:
+            for mesh_entry in utils.iter_json_meshes(json_path):
+                yield mesh_entry
+        except Exception as e:
+            print("Failed to load JSON: {}".format(e))
+
+    # ---------------------------------------------------------------------------------------------------------------------------
+    # Build a short name -> transform path index of the scene in one pass
+    # ---------------------------------------------------------------------------------------------------------------------------
+    def _build_scene_index(self):
+        """
+        Index every shape and transform by its short name (no path, no namespace).
+        Shapes are stored as their parent transform and come before plain transforms.
+        """
+        index = defaultdict(list)
+
+        shapes = cmds.ls(type=("mesh", "nurbsSurface", "subdiv"), long=True) or []
+        for node in shapes:
+            short = node.split("|")[-1].split(":")[-1]
+            parent = node.rsplit("|", 1)[0]
+            index[short].append(parent if parent else node)
+
+        transforms = cmds.ls(type="transform", long=True) or []
+        for node in transforms:
+            short = node.split("|")[-1].split(":")[-1]
+            index[short].append(node)
+
+        self._scene_index = index
+        return index
+
+    # ---------------------------------------------------------------------------------------------------------------------------
+    # Drop the scene index so the next lookup goes through cmds.ls again
+    # ---------------------------------------------------------------------------------------------------------------------------
+    def invalidate_scene_index(self):
+        self._scene_index = None
+
     # ---------------------------------------------------------------------------------------------------------------------------
     # Find an object in the Maya scene by its path
     # ---------------------------------------------------------------------------------------------------------------------------
     def find_object_in_scene(self, object_path):
         short_name = object_path.split("|")[-1].split(":")[-1]  # Extract short name without namespace or path
 
-        # First try: search for shape nodes (any namespace)
-        matches = cmds.ls("*:{}*".format(short_name), long=True) or []
-        if matches:
-            try:
-                # If it's a reference, print the namespace for info
-                reference_node = cmds.referenceQuery(matches[0], referenceNode=True)
-                if reference_node:
-                    namespace = cmds.referenceQuery(reference_node, namespace=True)
-                    # print("Found in reference namespace '{}': {}".format(namespace, matches[0]))
-            except:
-                pass  # Not referenced, or failed to query, ignore
+        # Fast path: use the prebuilt scene index
+        if self._scene_index is not None:
+            hits = self._scene_index.get(short_name) or self._scene_index.get(short_name.replace("Shape", ""))
+            if hits:
+                return hits[0]
+
+        # First try: exact name in any namespace (no substring matching)
+        matches = cmds.ls(short_name, long=True, recursive=True) or []
 
+        # Second try: legacy wildcard search for shape nodes (any namespace)
+        if not matches:
+            matches = cmds.ls("*:{}*".format(short_name), long=True) or []
+
+        if matches:
             # print("Found matching shape(s):", matches)
             return self.get_parent_transform(matches[0])
 
-        # Second try: search for transform nodes (any namespace)
-        matches = cmds.ls("*:{}*".format(short_name.replace("Shape", "")), long=True, type="transform") or []
+        # Last try: search for transform nodes (any namespace)
+        transform_name = short_name.replace("Shape", "")
+        matches = cmds.ls(transform_name, long=True, recursive=True, type="transform") or []
+        if not matches:
+            matches = cmds.ls("*:{}*".format(transform_name), long=True, type="transform") or []
         if matches:
             print("Found matching transform(s):", matches)
             return matches[0]
@@ -113,17 +180,70 @@ class ShaderAssigner(object):
                 return False
         return True
 
+    # ---------------------------------------------------------------------------------------------------------------------------
+    # Quantize an RGB color into a bin of size COLOR_BIN_SIZE
+    # ---------------------------------------------------------------------------------------------------------------------------
+    def _quantize(self, color_rgb):
+        step = self.COLOR_BIN_SIZE
+        return (int(color_rgb[0]) // step, int(color_rgb[1]) // step, int(color_rgb[2]) // step)
+
+    # ---------------------------------------------------------------------------------------------------------------------------
+    # Yield the bins that can hold a color within one bin of `key`
+    # ---------------------------------------------------------------------------------------------------------------------------
+    def _neighbor_bins(self, key, tolerance):
+        if tolerance <= 0:
+            yield key
+            return
+        r, g, b = key
+        for dr in (-1, 0, 1):
+            for dg in (-1, 0, 1):
+                for db in (-1, 0, 1):
+                    yield (r + dr, g + dg, b + db)
+
+    # ---------------------------------------------------------------------------------------------------------------------------
+    # Find a cached shading group within `tolerance` (<= COLOR_BIN_SIZE) via the neighbouring bins
+    # ---------------------------------------------------------------------------------------------------------------------------
+    def _find_in_bins(self, color_rgb, tolerance):
+        for bin_key in self._neighbor_bins(self._quantize(color_rgb), tolerance):
+            for cached_color, sg in self._bin_cache.get(bin_key, ()):
+                if self.colors_match(color_rgb, cached_color, tolerance):
+                    return sg
+        return None
+
+    # ---------------------------------------------------------------------------------------------------------------------------
+    # Find a cached shading group within any `tolerance`, testing all cached colors at once
+    # ---------------------------------------------------------------------------------------------------------------------------
+    def _find_in_array(self, color_rgb, tolerance):
+        if np is None:
+            for cached_color, sg in self.shader_cache.items():
+                if self.colors_match(color_rgb, cached_color, tolerance):
+                    return sg
+            return None
+
+        if not self._cached_sgs:
+            return None
+        diffs = np.abs(self._cached_arr[:len(self._cached_sgs)] - np.asarray(color_rgb, dtype=np.int16))
+        hits = (diffs <= tolerance).all(axis=1)
+        if not hits.any():
+            return None
+        return self._cached_sgs[int(np.argmax(hits))]
+
     # ---------------------------------------------------------------------------------------------------------------------------
     # Get or create a shader for a given RGB color, checking the cache first
     # ---------------------------------------------------------------------------------------------------------------------------
     def get_or_create_shader_for_color(self, color_rgb, tolerance=2):
         """
         Check if a shader for this color (within tolerance) already exists.
+        Tolerances up to COLOR_BIN_SIZE only check the 27 neighbouring bins,
+        larger ones test every cached color in one numpy pass.
         """
-        for cached_color, sg in self.shader_cache.items():
-            if self.colors_match(color_rgb, cached_color, tolerance):
-                # print(" Reusing shader for color {} (matched with {})".format(color_rgb, cached_color))
-                return sg
+        if tolerance <= self.COLOR_BIN_SIZE:
+            sg = self._find_in_bins(color_rgb, tolerance)
+        else:
+            sg = self._find_in_array(color_rgb, tolerance)
+        if sg:
+            # print(" Reusing shader for color {}".format(color_rgb))
+            return sg
 
         # Create new shader
         if color_rgb == (0, 0, 0):
@@ -133,65 +253,98 @@ class ShaderAssigner(object):
             shader_name     = "shader_{:03d}_{:03d}_{:03d}".format(*color_rgb)
             shader, sg      = self.create_lambert_shader(shader_name, color_rgb)
             self.shader_cache[tuple(color_rgb)] = sg
+            self._bin_cache[self._quantize(color_rgb)].append((tuple(color_rgb), sg))
+            if np is not None:
+                count = len(self._cached_sgs)
+                if count == len(self._cached_arr):
+                    grown = np.empty((count * 2, 3), dtype=np.int16)
+                    grown[:count] = self._cached_arr
+                    self._cached_arr = grown
+                self._cached_arr[count] = color_rgb
+            self._cached_sgs.append(sg)
             return sg
 
+    # ---------------------------------------------------------------------------------------------------------------------------
+    # Resolve one already-parsed mesh entry and queue its shading group in `assignments`
+    # ---------------------------------------------------------------------------------------------------------------------------
+    def _assign_one_mesh(self, mesh_data, assignments):
+        """
+        Returns True if a shading group was queued for the mesh, None when the object
+        is not in the scene, and False when its samples give no usable color
+        (no samples, or a black sample that needs the dominant color).
+        """
+        object_path = mesh_data.get("object")
+        uv_sets     = mesh_data.get("uv_sets", [])
+
+        if not object_path:
+            print(" No object path found for a mesh entry.")
+            return None
+
+        if not uv_sets:
+            print("No UV sets found for object: {}".format(object_path))
+            return False
+
+        # Find the object in the scene
+        object_in_scene = self.find_object_in_scene(object_path)
+        if not object_in_scene:
+            return None
+
+        # Try to get the first valid sample color from any UV set
+        color = None
+        for uv in uv_sets:
+            samples = uv.get("samples", [])
+            if samples:
+                color = samples[0].get("color")
+                if color:
+                    break
+
+        if not color:
+            # print(" No sample color found for object: {}".format(object_path))
+            return False
+
+        # Black samples are resolved by the dominant color sampler
+        if color == [0,0,0]:
+            print(" Processing object: {}, color: {}".format(object_in_scene, color))
+            return False
+        
+        shading_group = self.get_or_create_shader_for_color(color, tolerance=2)
+        if not shading_group:
+            return False
+
+        assignments[shading_group].append(object_in_scene)
+        return True
+
     # ---------------------------------------------------------------------------------------------------------------------------
     # Process the JSON data and assign shaders to objects based on their sample colors
     # ---------------------------------------------------------------------------------------------------------------------------
     def process_json_and_assign_shaders(self, json_path):
-        data = self.load_json_data(json_path)
-        if not data:
+        if not os.path.exists(json_path):
+            print("JSON file not found:", json_path)
             return
 
-        meshes = data.get("meshes", [])
-        if not meshes:
-            print("No 'meshes' found in JSON.")
-            return
+        # One undo chunk, evaluation and refresh paused for the whole run
+        with utils.bulk_edit():
+            self._build_scene_index()
+            assignments = defaultdict(list)
+            mesh_count  = 0
+
+            for mesh_data in self.iter_json_meshes(json_path):
+                mesh_count += 1
+                self._assign_one_mesh(mesh_data, assignments)
+
+            if not mesh_count:
+                print("No 'meshes' found in JSON.")
+                self.invalidate_scene_index()
+                return
+
+            # Assign shaders, one cmds.sets call per shading group
+            utils.assign_shading_groups(assignments)
+
+            # sample is null/empty, it uses the
+            # Dominant Color Sampler to find the color and assign a shader.
+            # Same assigner, so its shader cache and scene index carry over
+            selected_color_sampler.assign_select_object(json_path, assigner=self)
 
-        for mesh_data in meshes:
-            object_path = mesh_data.get("object")
-            uv_sets     = mesh_data.get("uv_sets", [])
-
-            if not object_path:
-                print(" No object path found for a mesh entry.")
-                continue
-
-            if not uv_sets:
-                print("No UV sets found for object: {}".format(object_path))
-                continue
-
-            # Find the object in the scene
-            object_in_scene = self.find_object_in_scene(object_path)
-            if not object_in_scene:
-                continue
-
-            # Try to get the first valid sample color from any UV set
-            color = None
-            for uv in uv_sets:
-                samples = uv.get("samples", [])
-                if samples:
-                    color = samples[0].get("color")
-                    if color == [0,0,0]:
-                        selected_color_sampler.apply_dominant_color_as_shader()
-
-                    if color:
-                        break
-
-            if not color:
-                # print(" No sample color found for object: {}".format(object_path))
-                continue
-
-            # Get or create shader
-            if color == [0,0,0]:
-                print(" Processing object: {}, color: {}".format(object_in_scene, color))
-                continue
-            
-            shading_group = self.get_or_create_shader_for_color(color, tolerance=2)
-
-            # Assign shader
-            self.assign_shader_to_object(object_in_scene, shading_group)
-
-        # sample is null/empty, it uses the
-        # Dominant Color Sampler to find the color and assign a shader.
-        selected_color_sampler.assign_select_object(json_path)
+            # Index is only valid for this run
+            self.invalidate_scene_index()
 # ---------------------------------------------------------------------------------------------------
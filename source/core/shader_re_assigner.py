@@ -6,16 +6,24 @@
 
 import json
 import re
+from collections import defaultdict
 import maya.cmds as cmds
 
+from core import utils
+
 # ==============================================================================================================
 # Helper function to get the shading group for a given shader or shading group
 # ==============================================================================================================
 def get_shading_group(shader_or_sg):
     """
     Ensure we return a shading group from either a shading group name or a material.
+    Returns None when the node does not exist or has no shading group.
     """
-    if cmds.objExists(shader_or_sg) and cmds.nodeType(shader_or_sg) == "shadingEngine":
+    # ls checks existence and gives the type in one call
+    found = cmds.ls(shader_or_sg, showType=True) or []
+    if not found:
+        return None
+    if found[1] == "shadingEngine":
         return shader_or_sg  # already SG
     
     # If it's a material, find its connected shading group(s)
@@ -38,23 +46,37 @@ def delete_unused_shaders():
         "initialShadingGroup", "initialParticleSE"
     ])
 
-    shading_groups = cmds.ls(type="shadingEngine")
-    deleted = []
+    shading_groups = set(cmds.ls(type="shadingEngine", long=False) or []) - safe_nodes
+    unused_sgs  = []
+    unused_mats = []
 
     for sg in shading_groups:
-        if sg in safe_nodes:
-            continue
-
         members = cmds.sets(sg, q=True) or []
         if members:
             continue
 
-        materials = cmds.listConnections(sg + ".surfaceShader") or []
+        unused_sgs.append(sg)
+        unused_mats.extend(cmds.listConnections(sg + ".surfaceShader") or [])
+
+    # Locked nodes (e.g. from references) can't be deleted and would fail the whole batch
+    candidates = unused_sgs + [m for m in set(unused_mats) if m not in safe_nodes]
+    if candidates:
+        locked = cmds.lockNode(candidates, q=True, lock=True) or []
+        candidates = [n for n, is_locked in zip(candidates, locked) if not is_locked]
+
+    deleted = []
+    if candidates:
         try:
-            cmds.delete([sg] + materials)
-            deleted.append(sg)
+            cmds.delete(candidates)
         except:
-            pass
+            # Fall back to one node at a time so a single failure doesn't block the rest
+            for node in candidates:
+                try:
+                    cmds.delete(node)
+                except:
+                    pass
+        remaining = set(cmds.ls(unused_sgs) or [])
+        deleted = [sg for sg in unused_sgs if sg not in remaining]
 
     if deleted:
         print("🗑️ Deleted unused shaders: {0}".format(", ".join(deleted)))
@@ -68,48 +90,69 @@ def re_assigner_old(json_path):
     Fixes "NOT a set" by resolving the shading group if a material is given.
     Works in Python 2.7.
     """
-    # Load JSON
-    with open(json_path, "r") as f:
-        try:
-            data = json.load(f)
-        except Exception as e:
-            print("❌ Failed to parse JSON: {0}".format(e))
-            return False
+    # Stream shader connections from JSON
+    assignments = defaultdict(list)
+
+    try:
+        for shader, info in utils.iter_json_shader_connections(json_path):
+            objects = info.get("connected_objects", [])
+            sg = get_shading_group(shader)
+            if not sg:
+                print("⚠️ Shader not found or has no shading group: {0}".format(shader))
+                continue
+
+            # One ls call filters every object of this shader, objExists only runs to report misses
+            existing = cmds.ls(objects) or []
+            if len(existing) < len(objects):
+                for obj in objects:
+                    if not cmds.objExists(obj):
+                        print("   ⚠️ Object not found: {0}".format(obj))
 
-    shader_connections = data.get("shader_connections", {})
+            assignments[sg].extend(existing)
 
-    for shader, info in shader_connections.items():
+    except Exception as e:
+        print("❌ Failed to parse JSON: {0}".format(e))
+        return False
+
+    with utils.bulk_edit():
+        # One cmds.sets call per shading group
+        utils.assign_shading_groups(assignments)
+        for sg, objects in assignments.items():
+            print("✅ Assigned {0} → {1} object(s)".format(sg, len(objects)))
+
+        # Cleanup pass after ALL assignments
+        delete_unused_shaders()
+    return True
+
+# ==============================================================================================================
+# Map each connected object's base name (no namespace) to its shading group
+# ==============================================================================================================
+def build_shape_to_sg(json_path):
+    """
+    Parse the shader JSON once and build an inverted index
+    {object base name: shading group}, so selected objects are a dict lookup.
+    """
+    shape_to_sg = {}
+
+    for shader, info in utils.iter_json_shader_connections(json_path):
         objects = info.get("connected_objects", [])
-        if not cmds.objExists(shader):
-            print("   ⚠️ Shader not found: {0}".format(shader))
-            continue
 
         sg = get_shading_group(shader)
-        if not sg or not cmds.objExists(sg):
-            print("⚠️ No shading group found for: {0}".format(shader))
+        if not sg:
+            print("⚠ Shader not found or has no shading group: {}".format(shader))
             continue
 
         for obj in objects:
-            if not cmds.objExists(obj):
-                print("   ⚠️ Object not found: {0}".format(obj))
-                continue
-
-            try:
-                cmds.sets(obj, e=True, forceElement=sg)
-                print("✅ Assigned {0} → {1}".format(sg, obj))
-                
-            except Exception as e:
-                print("❌ Failed assigning {0} → {1} ({2})".format(sg, obj, e))
+            shape_to_sg[obj.split(":")[-1]] = sg
 
-    # Cleanup pass after ALL assignments
-    delete_unused_shaders()
-    return True
+    return shape_to_sg
 
 # ==============================================================================================================
-def re_assigner_selectedObjects(json_path, selectedObjs):
+def re_assigner_selectedObjects(json_path, selectedObjs, shape_to_sg=None):
     """
     Reassign shaders (materials or shading groups) to selected objects in Maya.
     Fixes 'NOT A SET' by resolving shading groups if a material is given.
+    Pass `shape_to_sg` from build_shape_to_sg() to avoid re-parsing the JSON per object.
     Works in Python 2.7
     """
 
@@ -119,47 +162,43 @@ def re_assigner_selectedObjects(json_path, selectedObjs):
     
     getShape            = cmds.listRelatives(str(selectedObjs), shapes=True, fullPath=True) or []
     selectedObjShape    = getShape[0].split(":")[-1] if getShape else ""
-    # Load JSON
-    try:
-        with open(json_path, "r") as f:
-            data = json.load(f)
-    except Exception as e:
-        print("❌ Failed to parse JSON: {}".format(e))
-        return False
-
-    shader_connections = data.get("shader_connections", {})
-
-    for shader, info in shader_connections.items():
-        objects = info.get("connected_objects", [])
-
-        if not cmds.objExists(shader):
-            print("⚠ Shader not found: {}".format(shader))
-            continue
 
-        sg = get_shading_group(shader)
-        if not sg or not cmds.objExists(sg):
-            print("⚠ No shading group found for: {}".format(shader))
-            continue
+    if shape_to_sg is None:
+        try:
+            shape_to_sg = build_shape_to_sg(json_path)
+        except Exception as e:
+            print("❌ Failed to parse JSON: {}".format(e))
+            return False
 
-        for obj in objects:
-            base_obj = obj.split(":")[-1]
-            if base_obj != selectedObjShape:
-                continue
+    sg = shape_to_sg.get(selectedObjShape)
+    if not sg:
+        return False
 
-            try:
-                cmds.sets(getShape[0], e=True, forceElement=sg)
-                print("✅ Assigned {} → {}".format(sg, selectedObjShape))
+    try:
+        cmds.sets(getShape[0], e=True, forceElement=sg)
+        print("✅ Assigned {} → {}".format(sg, selectedObjShape))
+    except Exception as e:
+        print("❌ Failed assigning {} → {} ({})".format(sg, selectedObjShape, e))
+        return False
 
-            except Exception as e:
-                print("❌ Failed assigning {} → {} ({})".format(sg, selectedObjShape, e))
+    return True
 
 # ==============================================================================================================
 # "E:\RTB\user\maya\textureTool\set\wEBAtriumA\r0008\OlderShader.json"
 # ==============================================================================================================
 def Select_Object_ReAssigner(json_path):
     selectedObjs = cmds.ls(selection=True)
-    for obj in selectedObjs:
-        re_assigner_selectedObjects(json_path, obj)
+
+    # Parse the JSON once for the whole selection
+    try:
+        shape_to_sg = build_shape_to_sg(json_path)
+    except Exception as e:
+        print("❌ Failed to parse JSON: {}".format(e))
+        return False
+
+    with utils.bulk_edit():
+        for obj in selectedObjs:
+            re_assigner_selectedObjects(json_path, obj, shape_to_sg)
 
     return True
 # ==============================================================================================================
\ No newline at end of file
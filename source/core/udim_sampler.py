@@ -6,20 +6,76 @@ import maya.cmds as cmds
 import os
 import re
 import math
+import time
 import json
+import multiprocessing
+from collections import OrderedDict
+
+# Pillow is imported on first use (see _load_pil), importing this module stays cheap
+Image = ImageFile = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import OpenImageIO as oiio
+except ImportError:
+    oiio = None
 
 try:
-    from PIL import Image, ImageFile
+    from concurrent.futures import ThreadPoolExecutor
 except ImportError:
-    raise ImportError("PIL (Pillow) library is required. Please install it.")
+    # Python 2.7 without the 'futures' backport
+    ThreadPoolExecutor = None
+
+# Dominant color only needs a thumbnail, read textures at 1/8 resolution
+DOMINANT_COLOR_REDUCE = 8
+
+# 4 digit tile number right before the file extension, e.g. tex_1001.png
+_UDIM_TAIL_RE = re.compile(r'(\d{4})(?=\.[^.]+$)')
+
+# Shader attributes probed for a file texture or flat color, in priority order
+SHADER_COLOR_ATTRS = ("color", "diffuseColor", "diffuseLitColor", "albedoColor", "baseColor")
+
+# Seconds between Qt event pumps while sampling
+PROCESS_EVENTS_INTERVAL = 0.1
+
+# Memory budget for decoded UDIM tiles kept across shapes, least recently used are dropped first
+# (a 4K RGB tile is 48 MB). Override with SHADER_TOOL_IMAGE_CACHE_MB or UDIMSampler(image_cache_mb=...)
+IMAGE_CACHE_MB = int(os.environ.get("SHADER_TOOL_IMAGE_CACHE_MB") or 512)
+
+# Returned by worker thread decodes that need the main thread JPEG repair
+_DECODE_FAILED = object()
 
 from core import utils
-reload(utils)
+if utils.DEV_MODE:
+    reload(utils)
 
 from PySide2 import QtWidgets, QtCore
 import maya.OpenMayaUI as omui
+import maya.api.OpenMaya as om2
 from shiboken2 import wrapInstance
 
+def _rgb_nbytes(img):
+    if img is None:
+        return 0
+    if np is not None and isinstance(img, np.ndarray):
+        return img.nbytes
+    width, height = img.size
+    return width * height * 3
+
+def _load_pil():
+    global Image, ImageFile
+    if Image is None:
+        try:
+            from PIL import Image as _Image, ImageFile as _ImageFile
+        except ImportError:
+            raise ImportError("PIL (Pillow) library is required. Please install it.")
+        Image, ImageFile = _Image, _ImageFile
+    return Image
+
 def get_maya_main_window():
     main_window_ptr = omui.MQtUtil.mainWindow()
     return wrapInstance(long(main_window_ptr), QtWidgets.QWidget)
@@ -28,43 +84,140 @@ def get_maya_main_window():
 # UDIM Sampler Class
 # =====================================================================================
 class UDIMSampler(object):
-    def __init__(self):
+    _shader_attr_cache = {}     # node type -> color attributes it has, shared by all samplers
+
+    def __init__(self, image_cache_mb=None):
         self.failed_textures = set()
+        self.image_cache_bytes = (image_cache_mb or IMAGE_CACHE_MB) * 1024 * 1024
+
+        # Per-run lookup caches, many shapes share the same shader / texture
+        self._shader_cache          = {}    # shape -> shader
+        self._sg_shader_cache       = {}    # shading groups -> shader
+        self._shader_info_cache     = {}    # shader -> {"type", "value"}
+        self._tex_path_cache        = {}    # file node -> texture path
+        self._tile_map_cache        = {}    # <UDIM> template -> {udim: path}
+        self._ftile_cache           = {}    # <f> template -> (udim, path) or None
+        self._image_cache           = OrderedDict()     # tile path -> RGB image (LRU)
+        self._image_cache_used      = 0     # bytes of decoded pixels in _image_cache
+        self._dominant_color_cache  = {}    # (path, mtime) -> rgb
+        self._last_mesh_fn          = (None, None)     # (shape, MFnMesh)
+
+    # ------------------------------------------------------------------------------------------------------------------------
+    # Drop cached scene lookups, call before a new pass over the scene
+    # ------------------------------------------------------------------------------------------------------------------------
+    def clear_caches(self):
+        self._shader_cache.clear()
+        self._sg_shader_cache.clear()
+        self._shader_info_cache.clear()
+        self._tex_path_cache.clear()
+        self._tile_map_cache.clear()
+        self._ftile_cache.clear()
+        self._image_cache.clear()
+        self._image_cache_used = 0
+        self._dominant_color_cache.clear()
+        self._last_mesh_fn = (None, None)
 
     # ------------------------------------------------------------------------------------------------------------------------
     # ------------------------------------------------------------------------------------------------------------------------
     def get_all_mesh_shapes(self):
         return cmds.ls(type="mesh", long=True) or []
 
+    # ------------------------------------------------------------------------------------------------------------------------
+    # Keep shapes whose top namespace is one of `namespace` (":ns", "a:b" or a list of them);
+    # shapes without a namespace are kept, as before
+    # ------------------------------------------------------------------------------------------------------------------------
+    def filter_shapes_by_namespace(self, shapes, namespace):
+        if not namespace:
+            return shapes
+        if isinstance(namespace, basestring):
+            namespace = [namespace]
+        ns_set = set(part for ns in namespace for part in ns.split(":") if part)
+
+        filtered = []
+        for shape in shapes:
+            short_name = shape.rsplit("|", 1)[-1]
+            if ":" not in short_name or short_name.split(":", 1)[0] in ns_set:
+                filtered.append(shape)
+        return filtered
+
     # ------------------------------------------------------------------------------------------------------------------------
     # ------------------------------------------------------------------------------------------------------------------------
     def get_shader_from_shape(self, shape_node):
-        shading_groups = cmds.listConnections(shape_node, type='shadingEngine') or []
-        shaders = cmds.ls(cmds.listConnections(shading_groups), materials=True) or []
-        return shaders[0] if shaders else None
+        if shape_node in self._shader_cache:
+            return self._shader_cache[shape_node]
+        shading_groups = tuple(cmds.listConnections(shape_node, type='shadingEngine') or [])
+        if shading_groups not in self._sg_shader_cache:
+            shaders = []
+            if shading_groups:
+                shaders = cmds.ls(cmds.listConnections(list(shading_groups)), materials=True) or []
+            self._sg_shader_cache[shading_groups] = shaders[0] if shaders else None
+        shader = self._sg_shader_cache[shading_groups]
+        self._shader_cache[shape_node] = shader
+        return shader
 
     # ------------------------------------------------------------------------------------------------------------------------
     # ------------------------------------------------------------------------------------------------------------------------
     def get_file_texture_or_color_from_shader(self, shader):
-        for attr in ["color", "diffuseColor", "diffuseLitColor", "albedoColor", "baseColor"]:
-            if cmds.attributeQuery(attr, node=shader, exists=True):
+        if shader not in self._shader_info_cache:
+            self._shader_info_cache[shader] = self._query_shader_info(shader)
+        return self._shader_info_cache[shader]
+
+    # ------------------------------------------------------------------------------------------------------------------------
+    # ------------------------------------------------------------------------------------------------------------------------
+    def _query_shader_info(self, shader):
+        attrs = self._color_attrs_for(shader)
+        for attr in SHADER_COLOR_ATTRS:
+            if attr in attrs:
                 connections = cmds.listConnections("{}.{}".format(shader, attr), type='file')
                 if connections:
                     return {"type": "file", "value": connections[0]}
                 try:
                     color = cmds.getAttr("{}.{}".format(shader, attr))
                     if color:
-                        return {"type": "color", "value": [int(c * 255) for c in color[0]]}
+                        return {"type": "color", "value": self._color_to_rgb255(color[0])}
                 except Exception as e:
                     print("Failed to get color: {}.{} -> {}".format(shader, attr, e))
         return None
 
+    # ------------------------------------------------------------------------------------------------------------------------
+    # Which SHADER_COLOR_ATTRS a shader has, from one listAttr per shader type (they are static attributes)
+    # ------------------------------------------------------------------------------------------------------------------------
+    def _color_attrs_for(self, shader):
+        node_type = cmds.nodeType(shader)
+        if node_type not in self._shader_attr_cache:
+            self._shader_attr_cache[node_type] = set(cmds.listAttr(shader) or []).intersection(SHADER_COLOR_ATTRS)
+        return self._shader_attr_cache[node_type]
+
+    # ------------------------------------------------------------------------------------------------------------------------
+    # 0-1 float color -> 0-255 int list (truncated, as before)
+    # ------------------------------------------------------------------------------------------------------------------------
+    def _color_to_rgb255(self, color):
+        if np is not None:
+            return np.multiply(color, 255).astype(np.int32).tolist()
+        return [int(c * 255) for c in color]
+
     # ------------------------------------------------------------------------------------------------------------------------
     # ------------------------------------------------------------------------------------------------------------------------
     def get_texture_file_path(self, file_node):
-        if not cmds.objExists(file_node + ".fileTextureName"):
-            return None
-        return cmds.getAttr(file_node + ".fileTextureName")
+        if file_node in self._tex_path_cache:
+            return self._tex_path_cache[file_node]
+        path = None
+        if cmds.objExists(file_node + ".fileTextureName"):
+            path = cmds.getAttr(file_node + ".fileTextureName")
+        self._tex_path_cache[file_node] = path
+        return path
+
+    # ------------------------------------------------------------------------------------------------------------------------
+    # Resolve the texture path of every file node feeding `shaders` up front,
+    # so later get_texture_file_path calls are cache hits
+    # ------------------------------------------------------------------------------------------------------------------------
+    def prefetch_texture_paths(self, shaders):
+        shaders = [s for s in set(shaders) if s]
+        if not shaders:
+            return
+        file_nodes = set(cmds.listConnections(shaders, type="file") or [])
+        for file_node in file_nodes - set(self._tex_path_cache):
+            self._tex_path_cache[file_node] = cmds.getAttr(file_node + ".fileTextureName")
 
     # ------------------------------------------------------------------------------------------------------------------------
     # ------------------------------------------------------------------------------------------------------------------------
@@ -72,7 +225,7 @@ class UDIMSampler(object):
         folder, filename = os.path.split(texture_path)
         if "<f>" in filename:
             return os.path.join(folder, filename.replace("<f>", "<UDIM>")).replace("\\", "/")
-        match = re.search(r'(\d{4})(?=\.[^.]+$)', filename)
+        match = _UDIM_TAIL_RE.search(filename)
         if not match:
             return texture_path
         udim_filename = filename[:match.start()] + "<UDIM>" + filename[match.end():]
@@ -81,6 +234,7 @@ class UDIMSampler(object):
     # ------------------------------------------------------------------------------------------------------------------------
     # ------------------------------------------------------------------------------------------------------------------------
     def fix_and_reload_jpeg(self, path):
+        _load_pil()
         ImageFile.LOAD_TRUNCATED_IMAGES = True
         try:
             img = Image.open(path)
@@ -98,52 +252,201 @@ class UDIMSampler(object):
     # ------------------------------------------------------------------------------------------------------------------------
     def get_dominant_color(self, image_path):
         try:
-            img = Image.open(image_path).convert("RGB")
-            img = img.resize((1, 1))
-            return img.getpixel((0, 0))
+            key = (image_path, os.path.getmtime(image_path))
+        except (OSError, TypeError):
+            key = (image_path, None)
+        if key not in self._dominant_color_cache:
+            self._dominant_color_cache[key] = self._compute_dominant_color(image_path)
+        return self._dominant_color_cache[key]
+
+    # ------------------------------------------------------------------------------------------------------------------------
+    # Dominant colors for many textures, decoded on worker threads (no Maya calls happen here)
+    # ------------------------------------------------------------------------------------------------------------------------
+    def get_dominant_colors(self, image_paths, max_workers=None):
+        paths = list(set(p for p in image_paths if p))
+        if ThreadPoolExecutor is None or len(paths) < 2:
+            return dict((p, self.get_dominant_color(p)) for p in paths)
+
+        workers = max_workers or min(len(paths), multiprocessing.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return dict(zip(paths, executor.map(self.get_dominant_color, paths)))
+
+    # ------------------------------------------------------------------------------------------------------------------------
+    # ------------------------------------------------------------------------------------------------------------------------
+    def _compute_dominant_color(self, image_path):
+        _load_pil()
+        try:
+            if np is None:
+                # No numpy: same 5 bit/channel histogram through PIL's getcolors
+                return self._pil_histogram_dominant_color(self._open_reduced_image(image_path))
+            return self._histogram_dominant_color(self._read_reduced_image(image_path))
         except Exception as e:
             print("Failed to get dominant color: {}".format(e))
             return None
 
     # ------------------------------------------------------------------------------------------------------------------------
+    # Read a texture as an HxWx3 uint8 array at roughly 1/DOMINANT_COLOR_REDUCE resolution
     # ------------------------------------------------------------------------------------------------------------------------
-    def sample_using_dominant_color(self, shape_node, uv_set_name, f_template):
-        """Sample UVs using dominant color from first available <f> tile."""
-        # Detect actual texture file replacing <f> with real UDIM
+    def _read_reduced_image(self, image_path, factor=DOMINANT_COLOR_REDUCE):
+        if oiio is not None:
+            arr = self._read_reduced_image_oiio(image_path, factor)
+            if arr is not None:
+                return arr
+
+        return np.asarray(self._open_reduced_image(image_path, factor))
+
+    # ------------------------------------------------------------------------------------------------------------------------
+    # PIL image in RGB at roughly 1/factor resolution (small textures are left as they are)
+    # ------------------------------------------------------------------------------------------------------------------------
+    def _open_reduced_image(self, image_path, factor=DOMINANT_COLOR_REDUCE):
+        img = Image.open(image_path)
+        width, height = img.size
+        if min(width, height) < factor * 64:
+            return img.convert("RGB")
+
+        target = (width // factor, height // factor)
+        if img.format == "JPEG":
+            # libjpeg decodes straight to a 1/2..1/8 scale, much cheaper than decode + reduce
+            img.draft("RGB", target)
+            width, height = img.size
+
+        # Whatever the draft left above the target, so every format ends up at about 1/factor
+        remaining = width // target[0]
+        if remaining > 1:
+            if hasattr(img, "reduce"):
+                img = img.reduce(remaining)
+            else:
+                img = img.resize((width // remaining, height // remaining))
+        return img.convert("RGB")
+
+    # ------------------------------------------------------------------------------------------------------------------------
+    # OpenImageIO path: pick the mip level closest to the target size, going through the shared ImageCache
+    # ------------------------------------------------------------------------------------------------------------------------
+    def _read_reduced_image_oiio(self, image_path, factor):
+        buf = oiio.ImageBuf(image_path)
+        if buf.has_error:
+            return None
+
+        miplevel = 0
+        while miplevel + 1 < buf.nmiplevels and (1 << (miplevel + 1)) <= factor:
+            miplevel += 1
+        if miplevel:
+            buf.reset(image_path, 0, miplevel)
+
+        arr = buf.get_pixels(oiio.UINT8)
+        if arr is None or buf.has_error:
+            return None
+        if arr.ndim == 2:
+            arr = arr[..., None]
+        if arr.shape[2] < 3:
+            # grey or grey + alpha: widen the grey channel to RGB, like PIL's convert("RGB")
+            arr = np.repeat(arr[..., :1], 3, axis=2)
+
+        # No mip map to read from, stride down instead
+        step = factor >> miplevel
+        if step > 1 and min(arr.shape[0], arr.shape[1]) >= step * 64:
+            arr = arr[::step, ::step]
+        return np.ascontiguousarray(arr[..., :3])
+
+    # ------------------------------------------------------------------------------------------------------------------------
+    # Most frequent color of an HxWx3 uint8 array, using a 5 bits/channel packed histogram
+    # ------------------------------------------------------------------------------------------------------------------------
+    def _histogram_dominant_color(self, arr):
+        if arr.shape[0] * arr.shape[1] > 1024 * 1024:
+            arr = arr[::4, ::4]
+        packed = (((arr[..., 0] >> 3).astype(np.uint32) << 10) |
+                  ((arr[..., 1] >> 3).astype(np.uint32) << 5) |
+                  (arr[..., 2] >> 3).astype(np.uint32))
+        counts = np.bincount(packed.ravel(), minlength=1 << 15)
+        idx = int(counts.argmax())
+        # Unpack and return the center of the winning bin
+        return (((idx >> 10) & 31) << 3 | 4, ((idx >> 5) & 31) << 3 | 4, (idx & 31) << 3 | 4)
+
+    # ------------------------------------------------------------------------------------------------------------------------
+    # Pure PIL version of _histogram_dominant_color, for Maya installs without numpy
+    # ------------------------------------------------------------------------------------------------------------------------
+    def _pil_histogram_dominant_color(self, img):
+        img.thumbnail((256, 256))
+        img = img.point(lambda c: c & 0xF8)     # 5 bits per channel
+        width, height = img.size
+        colors = img.getcolors(maxcolors=width * height)
+        if not colors:
+            return None
+        r, g, b = max(colors)[1]
+        # center of the winning bin, as in the numpy path
+        return (r | 4, g | 4, b | 4)
+
+    # ------------------------------------------------------------------------------------------------------------------------
+    # First tile on disk matching an <f> template: (udim_number, texture_path), or None
+    # ------------------------------------------------------------------------------------------------------------------------
+    def _find_f_tile(self, f_template):
         folder, base = os.path.split(f_template)
-        base_regex = re.escape(base).replace("\\<f\\>", r"(\d{4})")  # Replace <f> with a regex group
+        base_regex = re.compile(re.escape(base).replace(re.escape("<f>"), r"(\d{4})"))  # Replace <f> with a regex group
 
         try:
             for fname in os.listdir(folder):
-                match = re.match(base_regex, fname)
+                match = base_regex.match(fname)
                 if match:
-                    udim_number = match.group(1)
-                    texture_path = os.path.join(folder, fname).replace("\\", "/")
-                    break
-            else:
-                print("No matching <f> tile found in: {}".format(folder))
-                return []
+                    return match.group(1), os.path.join(folder, fname).replace("\\", "/")
         except Exception as e:
             print("Error searching for <f> tile: {}".format(e))
+            return None
+
+        print("No matching <f> tile found in: {}".format(folder))
+        return None
+
+    # ------------------------------------------------------------------------------------------------------------------------
+    # MFnMesh of a shape, the last one is kept since every UV set of a shape is read in a row
+    # ------------------------------------------------------------------------------------------------------------------------
+    def _mesh_fn(self, shape_node):
+        if self._last_mesh_fn[0] != shape_node:
+            sel = om2.MSelectionList()
+            sel.add(shape_node)
+            self._last_mesh_fn = (shape_node, om2.MFnMesh(sel.getDagPath(0)))
+        return self._last_mesh_fn[1]
+
+    # ------------------------------------------------------------------------------------------------------------------------
+    # UV set names of a shape, without a polyUVSet command
+    # ------------------------------------------------------------------------------------------------------------------------
+    def get_uv_set_names(self, shape_node):
+        try:
+            return list(self._mesh_fn(shape_node).getUVSetNames())
+        except RuntimeError:
             return []
 
-        # Use detected texture
+    # ------------------------------------------------------------------------------------------------------------------------
+    # U and V arrays of one UV set (current set when None) from a single MFnMesh.getUVs call
+    # ------------------------------------------------------------------------------------------------------------------------
+    def get_mesh_uvs(self, shape_node, uv_set_name=None):
+        return self._mesh_fn(shape_node).getUVs(uv_set_name or "")
+
+    # ------------------------------------------------------------------------------------------------------------------------
+    # ------------------------------------------------------------------------------------------------------------------------
+    def sample_using_dominant_color(self, shape_node, uv_set_name, f_template):
+        """Sample UVs using dominant color from first available <f> tile."""
+        # Detect actual texture file replacing <f> with real UDIM (once per template)
+        if f_template not in self._ftile_cache:
+            self._ftile_cache[f_template] = self._find_f_tile(f_template)
+        if not self._ftile_cache[f_template]:
+            return []
+        udim_number, texture_path = self._ftile_cache[f_template]
+
+        # Use detected texture (dominant color is cached per file)
         dominant_color = self.get_dominant_color(texture_path)
         if not dominant_color:
             print("⚠ Failed to extract dominant color from: {}".format(texture_path))
             return []
 
         # Sample UVs and apply dominant color
-        uv_components = cmds.polyListComponentConversion(shape_node, toUV=True)
-        uv_components = cmds.ls(uv_components, flatten=True)
+        try:
+            us, vs = self.get_mesh_uvs(shape_node, uv_set_name)
+        except RuntimeError:
+            return []
 
         results = []
-        for uv in uv_components:
-            coords = cmds.polyEditUV(uv, query=True)
-            if not coords:
-                continue
+        for u, v in zip(us, vs):
             results.append({
-                "uv": coords,
+                "uv": [u, v],
                 "tile": int(udim_number),
                 "pixel": None,
                 "color": dominant_color,
@@ -154,131 +457,306 @@ class UDIMSampler(object):
     # ------------------------------------------------------------------------------------------------------------------------
     # ------------------------------------------------------------------------------------------------------------------------
     def sample_uv_colors_from_udim(self, shape_node, uv_set_name, udim_template):
-        available_uv_sets = cmds.polyUVSet(shape_node, query=True, allUVSets=True) or []
-        if uv_set_name not in available_uv_sets:
+        _load_pil()
+        # Read the UV set directly, no need to switch the mesh's current UV set
+        try:
+            us, vs = self.get_mesh_uvs(shape_node, uv_set_name)
+        except RuntimeError:
             return []
-        uv_components = cmds.ls(cmds.polyListComponentConversion(shape_node, toUV=True), flatten=True)
-        original_uv_set = cmds.polyUVSet(shape_node, query=True, currentUVSet=True)[0]
-        cmds.polyUVSet(shape_node, currentUVSet=True, uvSet=uv_set_name)
-        image_cache, results = {}, []
+        if np is not None and len(us):
+            return self._sample_udim_tiles_np(us, vs, udim_template)
+
+        self.prefetch_udim_tiles(udim_template, sorted(set(
+            1001 + int(math.floor(u)) + int(math.floor(v)) * 10 for u, v in zip(us, vs))))
+
+        results = []
+        for u, v in zip(us, vs):
+            tile_u, tile_v = int(math.floor(u)), int(math.floor(v))
+            udim_number = 1001 + tile_u + tile_v * 10
+            img = self._load_udim_tile(self._udim_tile_path(udim_template, udim_number))
+            if not img:
+                continue
+            width, height = img.size
+            px = min(int((u - tile_u) * width), width - 1)
+            py = min(int((1.0 - (v - tile_v)) * height), height - 1)
+            try:
+                color = img.getpixel((px, py))
+            except Exception as e:
+                color = None
+            results.append({"uv": [u, v], "tile": udim_number, "pixel": [px, py], "color": color})
+        return results
+
+    # ------------------------------------------------------------------------------------------------------------------------
+    # Tiles of a <UDIM> template that exist on disk, from one listdir per template: {udim_number: path}
+    # Returns None when the template has no <UDIM> token (a single texture)
+    # ------------------------------------------------------------------------------------------------------------------------
+    def get_udim_tiles(self, udim_template):
+        if "<UDIM>" not in udim_template:
+            return None
+        if udim_template in self._tile_map_cache:
+            return self._tile_map_cache[udim_template]
+
+        folder, base = os.path.split(udim_template)
+        pattern = re.compile("^" + re.escape(base).replace(re.escape("<UDIM>"), r"(\d{4})") + "$",
+                             re.IGNORECASE if os.name == "nt" else 0)
+        tiles = {}
         try:
-            for uv in uv_components:
-                coords = cmds.polyEditUV(uv, query=True)
-                if not coords:
-                    continue
-                u, v = coords
-                tile_u, tile_v = int(math.floor(u)), int(math.floor(v))
-                udim_number = 1001 + tile_u + tile_v * 10
-                texture_path = udim_template.replace("<UDIM>", str(udim_number)).replace("<f>", str(udim_number))
-                if texture_path not in image_cache:
-                    if not os.path.exists(texture_path):
-                        self.failed_textures.add(texture_path)
-                        image_cache[texture_path] = None
-                        continue
-                    try:
-                        img = Image.open(texture_path).convert("RGB")
-                        image_cache[texture_path] = img
-                    except Exception as e:
-                        if texture_path.lower().endswith(('.jpg', '.jpeg', '.jfif')):
-                            img = self.fix_and_reload_jpeg(texture_path)
-                            image_cache[texture_path] = img if img else None
-                        else:
-                            image_cache[texture_path] = None
-                        continue
-                img = image_cache[texture_path]
-                if not img:
-                    continue
-                width, height = img.size
-                px = min(int((u - tile_u) * width), width - 1)
-                py = min(int((1.0 - (v - tile_v)) * height), height - 1)
-                try:
-                    color = img.getpixel((px, py))
-                except Exception as e:
-                    color = None
-                results.append({"uv": [u, v], "tile": udim_number, "pixel": [px, py], "color": color})
+            for fname in os.listdir(folder or "."):
+                match = pattern.match(fname)
+                if match:
+                    tiles[int(match.group(1))] = os.path.join(folder, fname).replace("\\", "/")
+        except OSError:
+            pass
+
+        self._tile_map_cache[udim_template] = tiles
+        return tiles
+
+    def _udim_tile_path(self, udim_template, udim_number):
+        tiles = self.get_udim_tiles(udim_template)
+        if tiles is None:
+            return udim_template
+        path = tiles.get(udim_number)
+        if path is None:
+            self.failed_textures.add(udim_template.replace("<UDIM>", str(udim_number)))
+        return path
+
+    # ------------------------------------------------------------------------------------------------------------------------
+    # Open a UDIM tile as an RGB image (an HxWx3 array when numpy is available), shared by every shape
+    # of the run; None when it is missing or unreadable
+    # ------------------------------------------------------------------------------------------------------------------------
+    def _load_udim_tile(self, texture_path):
+        if texture_path is None:
+            return None
+        cache = self._image_cache
+        if texture_path in cache:
+            img = cache.pop(texture_path)
+            cache[texture_path] = img   # most recently used
+            return img
+
+        self._cache_udim_tile(texture_path, self._decode_udim_tile(texture_path))
+        return cache[texture_path]
+
+    def _cache_udim_tile(self, texture_path, img):
+        cache = self._image_cache
+        if texture_path in cache:
+            self._image_cache_used -= _rgb_nbytes(cache.pop(texture_path))
+        cache[texture_path] = img
+        self._image_cache_used += _rgb_nbytes(img)
+        # The tile just added is always kept, even when it alone is over budget
+        self._trim_image_cache(self.image_cache_bytes, keep=1)
+
+    def _trim_image_cache(self, budget, keep=0):
+        cache = self._image_cache
+        while len(cache) > keep and self._image_cache_used > budget:
+            self._image_cache_used -= _rgb_nbytes(cache.popitem(last=False)[1])
+
+    def _decode_udim_tile(self, texture_path):
+        img = self._decode_udim_tile_worker(texture_path)
+        if img is _DECODE_FAILED:
+            img = None
+            if texture_path.lower().endswith(('.jpg', '.jpeg', '.jfif')):
+                img = self._tile_pixels(self.fix_and_reload_jpeg(texture_path))
+        return img
+
+    # With numpy the cache keeps the HxWx3 array instead of the PIL image, so a tile shared by
+    # many shapes is converted once (and the array's bytes are what the cache budget counts)
+    def _tile_pixels(self, img):
+        if img is None or np is None:
+            return img
+        return np.asarray(img)
+
+    # PIL decoding only, safe to run on a worker thread: a tile that fails to decode is reported
+    # as _DECODE_FAILED and left to _decode_udim_tile, since the JPEG repair rewrites the file on disk
+    # and flips the process-wide ImageFile.LOAD_TRUNCATED_IMAGES
+    def _decode_udim_tile_worker(self, texture_path):
+        if not os.path.exists(texture_path):
+            self.failed_textures.add(texture_path)
+            return None
+        try:
+            return self._tile_pixels(Image.open(texture_path).convert("RGB"))
+        except Exception:
+            return _DECODE_FAILED
+
+    # ------------------------------------------------------------------------------------------------------------------------
+    # Decode the tiles a shape is about to sample on worker threads (PIL releases the GIL while decoding),
+    # then hand them to the LRU on the calling thread
+    # ------------------------------------------------------------------------------------------------------------------------
+    def prefetch_udim_tiles(self, udim_template, udim_numbers, max_workers=None):
+        cache = self._image_cache
+        paths = []
+        for udim_number in udim_numbers:
+            path = self._udim_tile_path(udim_template, udim_number)
+            if path is None or path in paths:
+                continue
+            if path in cache:
+                cache[path] = cache.pop(path)   # needed again, keep it ahead of the trim below
+            else:
+                paths.append(path)
+        if ThreadPoolExecutor is None or len(paths) < 2:
+            return
+
+        # Only decode what fits in the cache budget (sizes come from the file headers), the extra
+        # tiles would be evicted unused. Older tiles are dropped first to make room, so the
+        # decoded results and the cache together stay within the budget too.
+        _load_pil()
+        fitting, total = [], 0
+        for path in paths:
+            nbytes = self._tile_header_nbytes(path)
+            if total + nbytes > self.image_cache_bytes:
+                break
+            fitting.append(path)
+            total += nbytes
+        paths = fitting
+        if len(paths) < 2:
+            return
+        self._trim_image_cache(self.image_cache_bytes - total)
+
+        workers = max_workers or min(len(paths), multiprocessing.cpu_count() or 1, 8)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            images = list(executor.map(self._decode_udim_tile_worker, paths))
+        for path, img in zip(paths, images):
+            # Failed tiles stay uncached, _load_udim_tile repairs them on the main thread
+            if img is not _DECODE_FAILED:
+                self._cache_udim_tile(path, img)
+
+    # Decoded RGB size of a tile from its header alone (no pixels are read), 0 when unreadable
+    def _tile_header_nbytes(self, texture_path):
+        try:
+            img = Image.open(texture_path)
+        except Exception:
+            return 0
+        try:
+            return _rgb_nbytes(img)
         finally:
-            cmds.polyUVSet(shape_node, currentUVSet=True, uvSet=original_uv_set)
+            img.close()
+
+    # ------------------------------------------------------------------------------------------------------------------------
+    # NumPy path: group UVs by UDIM tile and gather every pixel of a tile with one fancy-index
+    # ------------------------------------------------------------------------------------------------------------------------
+    def _sample_udim_tiles_np(self, us, vs, udim_template):
+        count = len(us)
+        u = np.fromiter(us, dtype=np.float64, count=count)
+        v = np.fromiter(vs, dtype=np.float64, count=count)
+        tile_u, tile_v = np.floor(u), np.floor(v)
+        udims = (1001 + tile_u + tile_v * 10).astype(np.int64)
+        tiles, inverse = np.unique(udims, return_inverse=True)
+
+        valid = np.zeros(count, dtype=bool)
+        px_all = np.zeros(count, dtype=np.int64)
+        py_all = np.zeros(count, dtype=np.int64)
+        colors = np.zeros((count, 3), dtype=np.int64)
+
+        self.prefetch_udim_tiles(udim_template, tiles.tolist())
+        for tile_index, udim_number in enumerate(tiles.tolist()):
+            arr = self._load_udim_tile(self._udim_tile_path(udim_template, udim_number))
+            if arr is None:
+                continue
+            height, width = arr.shape[:2]
+
+            sel = np.nonzero(inverse == tile_index)[0]
+            px = np.minimum(((u[sel] - tile_u[sel]) * width).astype(np.int64), width - 1)
+            py = np.minimum(((1.0 - (v[sel] - tile_v[sel])) * height).astype(np.int64), height - 1)
+            px_all[sel], py_all[sel] = px, py
+            colors[sel] = arr[py, px]
+            valid[sel] = True
+
+        # Back to per-UV records, in the original UV order
+        results = []
+        for i in np.nonzero(valid)[0].tolist():
+            results.append({
+                "uv": [float(u[i]), float(v[i])],
+                "tile": int(udims[i]),
+                "pixel": [int(px_all[i]), int(py_all[i])],
+                "color": tuple(colors[i].tolist()),
+            })
         return results
 
     # ------------------------------------------------------------------------------------------------------------------------
     # ------------------------------------------------------------------------------------------------------------------------
-    def sample_flat_color(self, shape_node, uv_set_name, rgb_color):
-        uv_components = cmds.ls(cmds.polyListComponentConversion(shape_node, toUV=True), flatten=True)
-        return [{"uv": cmds.polyEditUV(uv, query=True), "tile": None, "pixel": None, "color": rgb_color}
-                for uv in uv_components if cmds.polyEditUV(uv, query=True)]
+    def sample_flat_color(self, shape_node, uv_set_name, rgb_color, limit=None):
+        try:
+            us, vs = self.get_mesh_uvs(shape_node, uv_set_name)
+        except RuntimeError:
+            return []
+        # Every UV gets the same color, only build the records the caller keeps
+        count = len(us) if limit is None else min(limit, len(us))
+        results = []
+        for i in xrange(count):
+            results.append({"uv": [us[i], vs[i]], "tile": None, "pixel": None, "color": rgb_color})
+        return results
 
     # ------------------------------------------------------------------------------------------------------------------------
     # ------------------------------------------------------------------------------------------------------------------------
     def sample_and_save_all_meshes(self, sample_count=5, json_output_path=None, reference_node=None, namespace=None):
-        shapes = self.get_all_mesh_shapes()
+        self.clear_caches()
+        shapes = self.filter_shapes_by_namespace(self.get_all_mesh_shapes(), namespace)
         if not shapes:
             return
-        matched_meshes = []
+
+        if not json_output_path:
+            json_output_path = os.path.join(cmds.internalVar(userTmpDir=True), "udim_samples.json").replace("\\", "/")
+
+        # Each mesh entry is written as soon as it is sampled, only one is held in memory at a time
+        try:
+            output_folder = os.path.dirname(json_output_path)
+            if not os.path.exists(output_folder):
+                os.makedirs(output_folder)
+            writer = utils.JsonListWriter(json_output_path, "meshes")
+        except Exception as e:
+            cmds.error(" Failed to save UV sample data: {}".format(e))
+            return
+
         progress_dialog = QtWidgets.QProgressDialog("Sampling meshes...", "Cancel", 0, len(shapes), get_maya_main_window())
         progress_dialog.setWindowTitle("UDIM Sampler")
         progress_dialog.setMinimumWidth(400)
         progress_dialog.setWindowModality(QtCore.Qt.WindowModal)
         progress_dialog.show()
-        for idx, shape in enumerate(shapes):
-            if progress_dialog.wasCanceled():
-                return
-            short_name = shape.split("|")[-1]
-            if ":" in short_name:
-                mesh_namespace = short_name.split(":")[0]
-                if namespace and mesh_namespace not in namespace:
+        last_pump = time.time()
+        with writer:
+            for idx, shape in enumerate(shapes):
+                if progress_dialog.wasCanceled():
+                    writer.abort()
+                    return
+                shader = self.get_shader_from_shape(shape)
+                if not shader:
                     continue
 
-            shader = self.get_shader_from_shape(shape)
-            if not shader:
-                continue
+                shader_info = self.get_file_texture_or_color_from_shader(shader)
+                if not shader_info:
+                    continue
 
-            shader_info = self.get_file_texture_or_color_from_shader(shader)
-            if not shader_info:
-                continue
+                uv_sets = self.get_uv_set_names(shape)
+                per_uv_samples = []
+                for uv_set in uv_sets:
+                    if shader_info["type"] == "file":
+                        texture_node = shader_info["value"]
+                        texture_path = self.get_texture_file_path(texture_node)
+                        if not texture_path:
+                            continue
 
-            uv_sets = cmds.polyUVSet(shape, query=True, allUVSets=True) or []
-            per_uv_samples = []
-            for uv_set in uv_sets:
-                if shader_info["type"] == "file":
-                    texture_node = shader_info["value"]
-                    texture_path = self.get_texture_file_path(texture_node)
-                    if not texture_path:
-                        continue
+                        if "<f>" in texture_path:
+                            uv_colors = self.sample_using_dominant_color(shape, uv_set, texture_path)
 
-                    if "<f>" in texture_path:
-                        uv_colors = self.sample_using_dominant_color(shape, uv_set, texture_path)
+                        else:
+                            udim_template   = self.convert_to_udim_template(texture_path)
+                            uv_colors       = self.sample_uv_colors_from_udim(shape, uv_set, udim_template)
 
                     else:
-                        udim_template   = self.convert_to_udim_template(texture_path)
-                        uv_colors       = self.sample_uv_colors_from_udim(shape, uv_set, udim_template)
+                        uv_colors = self.sample_flat_color(shape, uv_set, shader_info["value"], limit=sample_count)
+
+                    per_uv_samples.append({"uv_set": uv_set, "samples": uv_colors[:sample_count]})
 
-                else:
-                    uv_colors = self.sample_flat_color(shape, uv_set, shader_info["value"])
-                    
-                per_uv_samples.append({"uv_set": uv_set, "samples": uv_colors[:sample_count]})
-                
-            if per_uv_samples:
-                matched_meshes.append({"object": shape, "uv_sets": per_uv_samples})
+                if per_uv_samples:
+                    writer.write({"object": shape, "uv_sets": per_uv_samples})
 
-            progress_dialog.setValue(idx + 1)
-            QtWidgets.QApplication.processEvents()
+                # setValue on a window-modal dialog pumps the event loop itself, so it is the throttled call
+                now = time.time()
+                if now - last_pump > PROCESS_EVENTS_INTERVAL:
+                    progress_dialog.setValue(idx + 1)
+                    last_pump = now
 
         progress_dialog.close()
-        json_data = {"meshes": matched_meshes}
 
-        if not json_output_path:
-            json_output_path = os.path.join(cmds.internalVar(userTmpDir=True), "udim_samples.json").replace("\\", "/")
-       
-        try:
-            output_folder = os.path.dirname(json_output_path)
-            if not os.path.exists(output_folder):
-                os.makedirs(output_folder)
-            with open(json_output_path, "w") as f:
-                json.dump(json_data, f, indent=4)
-        except Exception as e:
-            cmds.error(" Failed to save UV sample data: {}".format(e))
-            return
-        
         utils._get_oldShader_(output_path=None, jsonfile=json_output_path)
         cmds.inViewMessage(amg='<hl>✔ UDIM Sampling complete</hl>', pos='topCenter', fade=True)
         return json_output_path
@@ -5,11 +5,29 @@
 import maya.cmds as cmds
 import json
 import os
+from contextlib import contextmanager
+
+try:
+	import ijson
+except ImportError:
+	ijson = None
+
+# Fastest available JSON decoder for whole-file reads
+try:
+	import orjson as _fast_json
+except ImportError:
+	try:
+		import ujson as _fast_json
+	except ImportError:
+		_fast_json = None
 
 SCRIPT_LOC 		= os.path.dirname(__file__)
 _root       	= os.path.abspath(os.path.join(SCRIPT_LOC, ".."))
 config_path 	= os.path.join(_root, "config", "config.json")
 
+# dev mode: set SHADER_TOOL_DEV=1 to reload the tool modules on import
+DEV_MODE 		= os.environ.get("SHADER_TOOL_DEV") == "1"
+
 # ---------------------------------------------------------------------------------------------------
 # Helper function to load configuration from JSON
 # ---------------------------------------------------------------------------------------------------
@@ -27,6 +45,210 @@ def load_config(config_path):
     print("Loaded config from {}".format(config_path))
     return config_data
 
+# ===============================================================================
+# Read and parse a whole JSON file, using orjson / ujson when installed
+# ===============================================================================
+def load_json_file(json_path):
+    """Parse a JSON file with the fastest available decoder."""
+    with open(json_path, "rb") as f:
+        raw = f.read()
+    if _fast_json is not None:
+        return _fast_json.loads(raw)
+    return json.loads(raw.decode("utf-8"))
+
+# ===============================================================================
+# Write compact JSON (no indent), using orjson / ujson when installed
+# ===============================================================================
+def _encode_json(data):
+    if _fast_json is not None:
+        raw = _fast_json.dumps(data)
+    else:
+        raw = json.dumps(data, separators=(",", ":"))
+    if not isinstance(raw, bytes):
+        raw = raw.encode("utf-8")
+    return raw
+
+def dump_json_file(data, json_path):
+    """Serialize `data` to `json_path` with the fastest available encoder."""
+    with open(json_path, "wb") as f:
+        f.write(_encode_json(data))
+
+# ===============================================================================
+# Write {key: [item, ...]} one item at a time, so a large list never has to be
+# held in memory. Items go to a temp file that replaces `json_path` on close();
+# abort() (or an exception inside a with block) discards it.
+# ===============================================================================
+class JsonListWriter(object):
+    def __init__(self, json_path, key):
+        self.json_path  = json_path
+        self.count      = 0
+        self._tmp_path  = json_path + ".tmp"
+        self._file      = open(self._tmp_path, "wb")
+        self._file.write(b'{' + _encode_json(key) + b':[')
+
+    def write(self, item):
+        if self.count:
+            self._file.write(b',')
+        self._file.write(_encode_json(item))
+        self.count += 1
+
+    def close(self):
+        if self._file is None:
+            return
+        self._file.write(b']}')
+        self._file.close()
+        self._file = None
+        if os.path.exists(self.json_path):
+            os.remove(self.json_path)    # os.rename does not overwrite on Windows
+        os.rename(self._tmp_path, self.json_path)
+
+    def abort(self):
+        if self._file is None:
+            return
+        self._file.close()
+        self._file = None
+        os.remove(self._tmp_path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+# ===============================================================================
+# Streaming JSON readers
+# Sample JSONs can be very large, so entries are yielded one at a time with
+# ijson when it is installed, falling back to load_json_file otherwise.
+# ===============================================================================
+def _ijson_items(f, prefix):
+    try:
+        return ijson.items(f, prefix, use_float=True)
+    except TypeError:
+        # ijson 2.x (Python 2.7) has no use_float
+        return ijson.items(f, prefix)
+
+def _ijson_kvitems(f, prefix):
+    try:
+        return ijson.kvitems(f, prefix, use_float=True)
+    except TypeError:
+        return ijson.kvitems(f, prefix)
+
+def iter_json_meshes(json_path):
+    """Yield the entries of the 'meshes' list of a sample JSON file."""
+    if ijson is not None:
+        with open(json_path, "rb") as f:
+            for mesh_entry in _ijson_items(f, "meshes.item"):
+                yield mesh_entry
+        return
+
+    data = load_json_file(json_path)
+    for mesh_entry in data.get("meshes") or []:
+        yield mesh_entry
+
+def iter_json_shader_connections(json_path):
+    """Yield (shader, info) pairs of the 'shader_connections' dict of a shader JSON file."""
+    if ijson is not None and hasattr(ijson, "kvitems"):
+        with open(json_path, "rb") as f:
+            for shader, info in _ijson_kvitems(f, "shader_connections"):
+                yield shader, info
+        return
+
+    data = load_json_file(json_path)
+    for shader, info in (data.get("shader_connections") or {}).items():
+        yield shader, info
+
+# ===============================================================================
+# Suspend viewport refresh and Script Editor echo while a bulk operation runs
+# Nested uses only resume refresh when the outermost block exits.
+# ===============================================================================
+_refresh_suspend_depth = [0]
+
+@contextmanager
+def suspend_refresh():
+    """Suspend viewport refresh and Script Editor result printing for the duration."""
+    prev_suppress = cmds.scriptEditorInfo(query=True, suppressResults=True)
+    if not _refresh_suspend_depth[0]:
+        cmds.refresh(suspend=True)
+    _refresh_suspend_depth[0] += 1
+    cmds.scriptEditorInfo(suppressResults=True)
+    try:
+        yield
+    finally:
+        cmds.scriptEditorInfo(suppressResults=prev_suppress)
+        _refresh_suspend_depth[0] -= 1
+        if not _refresh_suspend_depth[0]:
+            cmds.refresh(suspend=False)
+
+# ===============================================================================
+# Group a bulk scene edit into one undo chunk with DG evaluation and viewport
+# refresh paused, restoring the previous evaluation mode afterwards.
+# ===============================================================================
+_bulk_edit_depth = [0]
+
+@contextmanager
+def bulk_edit():
+    """One undo chunk, evaluation manager off and refresh suspended for the duration.
+    Nested blocks join the outermost one, only it switches the evaluation mode."""
+    if _bulk_edit_depth[0]:
+        _bulk_edit_depth[0] += 1
+        try:
+            yield
+        finally:
+            _bulk_edit_depth[0] -= 1
+        return
+
+    prev_mode = (cmds.evaluationManager(query=True, mode=True) or ["off"])[0]
+    cmds.undoInfo(openChunk=True)
+    _bulk_edit_depth[0] += 1
+    try:
+        cmds.evaluationManager(mode="off")
+        with suspend_refresh():
+            yield
+    finally:
+        _bulk_edit_depth[0] -= 1
+        cmds.evaluationManager(mode=prev_mode)
+        cmds.undoInfo(closeChunk=True)
+
+# ===============================================================================
+# Assign objects to shading groups in bulk
+# Issues one cmds.sets call per shading group instead of one per object,
+# inside a bulk_edit block.
+# ===============================================================================
+def assign_shading_groups(assignments):
+    """
+    Assign objects to shading groups in as few Maya commands as possible.
+
+    Args:
+        assignments (dict): Shading group name -> list of objects/components.
+
+    Returns:
+        int: Number of objects assigned.
+    """
+    if not assignments:
+        return 0
+
+    assigned = 0
+    with bulk_edit():
+        for sg, objects in assignments.items():
+            if not objects:
+                continue
+            try:
+                cmds.sets(objects, edit=True, forceElement=sg)
+                assigned += len(objects)
+            except Exception:
+                # One bad member fails the whole batch, retry one by one to isolate it
+                for obj in objects:
+                    try:
+                        cmds.sets(obj, edit=True, forceElement=sg)
+                        assigned += 1
+                    except Exception as e:
+                        print(" Failed to assign shader to '{}': {}".format(obj, e))
+
+    return assigned
+
 # ===============================================================================
 # Utility function to get shader connections and object counts 
 # from selected objects or a JSON file.
@@ -53,13 +275,10 @@ def _get_oldShader_(output_path=None, jsonfile=None):
 			return
 
 		try:
-			with open(jsonfile, 'r') as f:
-				json_data = json.load(f)
+			# Streamed, only the object paths are kept
+			shapes = [entry["object"] for entry in iter_json_meshes(jsonfile) if "object" in entry]
 			print("Loaded JSON data from:", jsonfile)
 
-			mesh_entries = json_data.get("meshes", [])
-			shapes = [entry["object"] for entry in mesh_entries if "object" in entry]
-
 		except Exception as e:
 			cmds.error("Failed to read JSON file: {}".format(e))
 			return
@@ -78,44 +297,45 @@ def _get_oldShader_(output_path=None, jsonfile=None):
 	# --------------------------------------
 	shader_info = {}
 
-	for shape in shapes:
-		if not cmds.objExists(shape):
-			print("Shape does not exist in scene:", shape)
-			continue
-
-		shading_engines = cmds.listConnections(shape, type="shadingEngine") or []
-		for sg in shading_engines:
-			shaders = cmds.listConnections(sg + ".surfaceShader", source=True) or []
-			for shader in shaders:
-				if shader not in shader_info:
-					shader_info[shader] = {
-						"connected_objects": [],
-						"object_count": 0,
-					}
+	# existence filter and shading groups for all shapes in one call each
+	existing = (cmds.ls(shapes, long=True) or []) if shapes else []
+	if len(existing) < len(shapes):
+		print("Shapes missing from scene:", len(shapes) - len(existing))
 
-				connected_objs = cmds.sets(sg, query=True) or []
-				for obj in connected_objs:
-					if obj not in shader_info[shader]["connected_objects"]:
-						shader_info[shader]["connected_objects"].append(obj)
+	shading_engines = set(cmds.listConnections(existing, type="shadingEngine") or []) if existing else set()
 
-				shader_info[shader]["object_count"] = len(shader_info[shader]["connected_objects"])
+	# shader + members queried once per shading group, not once per shape
+	for sg in shading_engines:
+		shaders = cmds.listConnections(sg + ".surfaceShader", source=True) or []
+		if not shaders:
+			continue
+		connected_objs = cmds.sets(sg, query=True) or []
+		for shader in shaders:
+			if shader not in shader_info:
+				shader_info[shader] = {
+					"connected_objects": set(),
+					"object_count": 0,
+				}
+			shader_info[shader]["connected_objects"].update(connected_objs)
 
 	if not shader_info:
 		cmds.warning("No shader connections found.")
 		return
 
+	# sets -> sorted lists for JSON, count once at the end
+	for info in shader_info.values():
+		info["connected_objects"] 	= sorted(info["connected_objects"])
+		info["object_count"] 		= len(info["connected_objects"])
+
 	json_data = {
 		"shader_connections": shader_info
 	}
 
-	print("Shader connection data:", json.dumps(json_data, indent=4))
-
 	output_path = os.path.dirname(jsonfile)
 	output_path = os.path.join(output_path, "OlderShader.json").replace("\\", "/")
 
 	try:
-		with open(output_path, "w") as f:
-			json.dump(json_data, f, indent=4)
+		dump_json_file(json_data, output_path)
 		print("Shader connection data saved to:", output_path)
 	except Exception as e:
 		cmds.error("Failed to save JSON: {}".format(e))
@@ -218,6 +438,21 @@ class ReferenceShaderNodeManager(object):
 		print("\n Done. Created %d shader network nodes." % len(self.created_nodes))
 		return self.created_nodes
 
+	# ---------------------------------------------------------------------------
+	# Only process references that do not have a shader metadata node yet
+	# ---------------------------------------------------------------------------
+	def process_missing_references(self):
+		"""Create shader metadata nodes for references that are not covered yet."""
+		covered = set()
+		for plug in cmds.ls("*_shaderInfo.referenceNode") or []:
+			covered.add(cmds.getAttr(plug))
+
+		for ref_node in self.get_all_reference_nodes():
+			if ref_node not in covered:
+				self.create_shader_node_for_reference(ref_node)
+
+		return self.created_nodes
+
 	# ---------------------------------------------------------------------------
 	def get_all_reference_nodes(self):
 		"""Return all user reference nodes, excluding internal ones like sharedReferenceNode."""
@@ -15,13 +15,15 @@
 import os
 import json
 import re
+from collections import deque
 
 import maya.cmds as cmds
+import maya.api.OpenMaya as om
 import maya.OpenMayaUI as omui
 from shiboken2 import wrapInstance
 from PySide2 import QtUiTools, QtWidgets, QtCore, QtGui
 from PySide2.QtWidgets import (
-	QMainWindow, QWidget, QMessageBox, QTableWidgetItem, QHeaderView, QAbstractItemView
+	QMainWindow, QWidget, QMessageBox, QHeaderView, QAbstractItemView
 )
 from PySide2.QtCore import QFile
 
@@ -31,31 +33,60 @@ shader_ui_file 	= os.path.join(SCRIPT_LOC, "ui", "shaderUI.ui")
 _root       	= os.path.abspath(os.path.join(SCRIPT_LOC, ".."))
 config_path 	= os.path.join(_root, "config", "config.json")
 
+# asset folder tokens (lower case) -> asset type
+_ASSET_TOKENS 		= frozenset(("character", "set", "setprop", "prop", "camera"))
+_ASSET_CANONICAL 	= {"setprop": "setProp"}
+_REV_RE 			= re.compile(r"^r\d+$", re.IGNORECASE)
+
+# table styling, built once and shared by every cell (brushes, so the delegate needs no QColor conversion)
+_ROW_FONT 		= QtGui.QFont("Arial", 10)
+_ALIGN_CENTER 	= QtCore.Qt.AlignCenter
+_FG_BRUSH 		= QtGui.QBrush(QtGui.QColor("#ffffff"))
+_STATUS_BRUSHES = {
+	"NA"				: QtGui.QBrush(QtGui.QColor("#c62828")),	# Red
+	"Shader-Generated"	: QtGui.QBrush(QtGui.QColor("#ff9800")),	# Orange
+	"Assigned"			: QtGui.QBrush(QtGui.QColor("#2e7d32")),	# Green
+	"Unknown"			: QtGui.QBrush(QtGui.QColor("#616161")),	# Gray fallback
+}
+
 from core import udim_sampler
 from core import shader_assigner
 from core import utils
 from core import shader_re_assigner
 
-reload(udim_sampler) 	# dev mode, reload the module
-reload(shader_assigner) # dev mode, reload the module
-reload(utils)
-reload(shader_re_assigner)
+if utils.DEV_MODE:
+	reload(udim_sampler) 		# dev mode, reload the module
+	reload(shader_assigner) 	# dev mode, reload the module
+	reload(utils)
+	reload(shader_re_assigner)
 
 
 # ---------------------------------------------------------------------------------------------------
 # Helper function to load configuration from JSON
 # ---------------------------------------------------------------------------------------------------
+_CONFIG_CACHE = {"path": None, "mtime": 0, "data": None}
+
 def load_config(config_path):
-    """Load shader tool configuration from JSON."""
-    if not os.path.exists(config_path):
+    """Load shader tool configuration from JSON.
+
+    The parsed config is cached and only re-read when the file's mtime changes.
+    """
+    try:
+        mtime = os.stat(config_path).st_mtime
+    except OSError:
         raise IOError("Config file not found: {}".format(config_path))
 
+    if (_CONFIG_CACHE["data"] is not None and _CONFIG_CACHE["path"] == config_path
+            and _CONFIG_CACHE["mtime"] == mtime):
+        return _CONFIG_CACHE["data"]
+
     with open(config_path, "r") as f:
         try:
             config_data = json.load(f)
         except Exception as e:
             raise ValueError("Failed to parse config file: {}".format(e))
 
+    _CONFIG_CACHE.update(path=config_path, mtime=mtime, data=config_data)
     print("Loaded config from {}".format(config_path))
     return config_data
 
@@ -85,8 +116,127 @@ def load_ui(ui_file, parent=None):
 	return ui_widget
 
 
+# ---------------------------------------------------------------------------------------------------
+# Table model for the shader reference rows
+# Rows are plain dicts, Qt only asks for the cells that are visible.
+# ---------------------------------------------------------------------------------------------------
+class ShaderRefModel(QtCore.QAbstractTableModel):
+	COLUMNS = [
+		("Reference_Path", "reference_path"),
+		("Asset_Type", "asset_type"),
+		("Assets_Name", "assets_name"),
+		("Revision", "revision"),
+		("Result", "result"),
+	]
+	RESULT_COLUMN = 4
+
+	def __init__(self, parent=None):
+		super(ShaderRefModel, self).__init__(parent)
+		self._rows = []
+
+	def rowCount(self, parent=QtCore.QModelIndex()):
+		return 0 if parent.isValid() else len(self._rows)
+
+	def columnCount(self, parent=QtCore.QModelIndex()):
+		return 0 if parent.isValid() else len(self.COLUMNS)
+
+	def data(self, index, role=QtCore.Qt.DisplayRole):
+		if not index.isValid():
+			return None
+		row, column = index.row(), index.column()
+
+		if role == QtCore.Qt.DisplayRole:
+			return self._rows[row][self.COLUMNS[column][1]]
+
+		if role == QtCore.Qt.TextAlignmentRole and column > 0:
+			return _ALIGN_CENTER
+
+		if column == self.RESULT_COLUMN:
+			if role == QtCore.Qt.BackgroundRole:
+				return _STATUS_BRUSHES.get(self._rows[row]["result"], _STATUS_BRUSHES["Unknown"])
+			if role == QtCore.Qt.ForegroundRole:
+				return _FG_BRUSH
+
+		return None
+
+	def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+		if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal:
+			return self.COLUMNS[section][0]
+		return super(ShaderRefModel, self).headerData(section, orientation, role)
+
+	# ---------------------------------------------------------------------------------------------------
+	def set_rows(self, rows):
+		"""Replace all rows in one model reset."""
+		self.beginResetModel()
+		self._rows = list(rows)
+		self.endResetModel()
+
+	def row_data(self, row):
+		return self._rows[row]
+
+	def rows(self):
+		return self._rows
+
+	def set_result(self, row, status):
+		"""Update the Result cell of one row."""
+		self._rows[row]["result"] = status
+		index = self.index(row, self.RESULT_COLUMN)
+		self.dataChanged.emit(index, index)
+
+
+# ---------------------------------------------------------------------------------------------------
+# Queued UDIM sampling
+# sample_and_save_all_meshes is maya.cmds plus a progress dialog from start to end, so it has to
+# stay on Maya's main thread. Instead of one blocking loop the worker runs a single asset per
+# event loop turn and reports each result as it lands.
+# ---------------------------------------------------------------------------------------------------
+class SamplerWorker(QtCore.QObject):
+	progress = QtCore.Signal(str, str)		# reference_path, status
+	finished = QtCore.Signal()
+
+	def __init__(self, process_item, parent=None):
+		super(SamplerWorker, self).__init__(parent)
+		self._process_item 	= process_item
+		self._items 		= deque()
+		self._running 		= False
+
+		# One owned timer rather than QTimer.singleShot, so cancel() can stop a pending step
+		self._timer = QtCore.QTimer(self)
+		self._timer.setSingleShot(True)
+		self._timer.timeout.connect(self._run_next)
+
+	def run(self, items):
+		self._items.extend(items)
+		if not self._running:
+			self._running = True
+			self._timer.start(0)
+
+	def cancel(self):
+		"""Drop the queued items without emitting finished."""
+		self._timer.stop()
+		self._items.clear()
+		self._running = False
+
+	def _run_next(self):
+		if not self._items:
+			self._running = False
+			self.finished.emit()
+			return
+
+		item = self._items.popleft()
+		try:
+			status = self._process_item(item)
+			if status:
+				self.progress.emit(item["reference_path"], status)
+		except Exception as e:
+			print("Error during UDIM sampling:", e)
+
+		if self._running:
+			self._timer.start(0)
+
+
 class ShaderToolWindow(QMainWindow):
-	REFERENCE_COLUMN_WIDTH = 600
+	REFERENCE_COLUMN_WIDTH = 750
 
 	# ---------------------------------------------------------------------------------------------------
 	# Constructor
@@ -108,16 +258,30 @@ class ShaderToolWindow(QMainWindow):
 			print("Error loading config: {}".format(e))
 			self.config = {}
 
-		# -- NETnetwork node 
-		manager = utils.ReferenceShaderNodeManager()
-		manager.process_all_references()
+		self._shader_path = self._normalize_shader_path(self.config)
+
+		# -- network node cache, dropped on scene change / network node add-remove
+		self._network_cache 	= None
+		self._script_jobs 		= []
+		self._callback_ids 		= []
+		self._register_scene_callbacks()
+
+		# asset folders already created this session
+		self._mkdir_cache 		= set()
+
+		# UDIM sampling queue, see SamplerWorker
+		self._existing_nodes 	= set()
+		self._sample_root 		= ""
+		self._sampler_worker 	= SamplerWorker(self._sample_item, self)
+		self._sampler_worker.progress.connect(self._on_sample_progress)
+		self._sampler_worker.finished.connect(self._on_sample_finished)
 
 		# Apply Dark Theme
 		# self.apply_stylesheet()
 
 		# Find UI elements
 		self.checkbox 					= self.ui.findChild(QtWidgets.QCheckBox, "checkBox")
-		self.table 						= self.ui.findChild(QtWidgets.QTableWidget, "tableWidget")
+		self.table 						= self.ui.findChild(QtWidgets.QTableView, "tableView")
 		self.generate_button 			= self.ui.findChild(QtWidgets.QPushButton, "pushButton")
 		self.assign_button 				= self.ui.findChild(QtWidgets.QPushButton, "pushButton_2")
 		self.re_assign_button 			= self.ui.findChild(QtWidgets.QPushButton, "ReAssigin_oldShader_BTN")
@@ -125,6 +289,10 @@ class ShaderToolWindow(QMainWindow):
 		self.filterCombox				= self.ui.findChild(QtWidgets.QComboBox, "comboBox")
 
 		# Set table properties
+		self._model = ShaderRefModel(self)
+		self.table.setModel(self._model)
+		self.table.setFont(_ROW_FONT)
+
 		# splitter resize
 		self.ui.splitter.setSizes([1, 1, 1])
 		self.ui.splitter_2.setSizes([1, 750])
@@ -135,6 +303,16 @@ class ShaderToolWindow(QMainWindow):
 		# Ensure full rows are selected (instead of individual cells)
 		self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
 
+		# ----------------------------------------
+		# Header sizing (run once, columns are fixed by the model)
+		# ----------------------------------------
+		header = self.table.horizontalHeader()
+		self.table.setColumnWidth(0, self.REFERENCE_COLUMN_WIDTH)
+		header.setStretchLastSection(True)
+
+		for i in range(1, self._model.columnCount()):
+			header.setSectionResizeMode(i, QHeaderView.Stretch)
+
 		# Connect signals
 		self.generate_button.clicked.connect(self.get_selected_table_rows)
 		self.assign_button.clicked.connect(self.assign_shader_to_objects) # Updated to call the correct method [ assign_shader_to_objects]
@@ -144,11 +322,39 @@ class ShaderToolWindow(QMainWindow):
 
 		# Populate
 		self._create_menu_bar()
-		self.populate_table()
-		self.get_data_from_table()
-		self.add_result_to_table()
+		self.populate_table()	# the model already serves the Result colors, no read-back / re-color pass
 		self._add_Asset_Type_filter()
 
+		# -- NETnetwork node, created after the window has painted
+		QtCore.QTimer.singleShot(0, self._ensure_shader_nodes_on_open)
+
+	# ---------------------------------------------------------------------------------------------------
+	# Create shader metadata network nodes for references that do not have one yet
+	# ---------------------------------------------------------------------------------------------------
+	def _ensure_shader_nodes(self):
+		"""Returns True when any node was created."""
+		manager = utils.ReferenceShaderNodeManager()
+		return bool(manager.process_missing_references())
+
+	def _ensure_shader_nodes_on_open(self):
+		if self._ensure_shader_nodes():
+			self._reload_table()
+
+	# ---------------------------------------------------------------------------------------------------
+	# Re-read the network nodes once and rebuild the asset type filter and the table from them
+	# ---------------------------------------------------------------------------------------------------
+	def _reload_table(self):
+		self._invalidate_cache()
+		self._add_Asset_Type_filter()	# before populate_table, which reads the filter
+		self.populate_table()
+
+	# ---------------------------------------------------------------------------------------------------
+	# File > Refresh: pick up new references, then re-read the network nodes
+	# ---------------------------------------------------------------------------------------------------
+	def refresh(self):
+		self._ensure_shader_nodes()
+		self._reload_table()
+
 	# ---------------------------------------------------------------------------------------------------
 	# Setup the main window
 	# ---------------------------------------------------------------------------------------------------
@@ -160,7 +366,8 @@ class ShaderToolWindow(QMainWindow):
 		refresh_action 	= file_menu.addAction("Refresh")
 		exit_action 	= file_menu.addAction("Exit")
 
-		refresh_action.triggered.connect(self.populate_table)
+		self._refresh_action = refresh_action
+		refresh_action.triggered.connect(self.refresh)
 		exit_action.triggered.connect(self.close)
 
 		# Help Menu
@@ -174,6 +381,42 @@ class ShaderToolWindow(QMainWindow):
 	def show_about_dialog(self):
 		QMessageBox.information(self, "About", "Shader Tool\nVersion 1.0\nAuthor: Sanjay Kamble")
 
+	# ---------------------------------------------------------------------------------------------------
+	# Network node cache invalidation
+	# ---------------------------------------------------------------------------------------------------
+	def _register_scene_callbacks(self):
+		for event in ("SceneOpened", "NewSceneOpened"):
+			self._script_jobs.append(cmds.scriptJob(event=[event, self._invalidate_cache]))
+
+		try:
+			self._callback_ids.append(
+				om.MDGMessage.addNodeAddedCallback(self._on_network_node_changed, "network"))
+			self._callback_ids.append(
+				om.MDGMessage.addNodeRemovedCallback(self._on_network_node_changed, "network"))
+		except Exception as e:
+			print("Failed to register network node callbacks: {}".format(e))
+
+	def _remove_scene_callbacks(self):
+		for job in self._script_jobs:
+			if cmds.scriptJob(exists=job):
+				cmds.scriptJob(kill=job, force=True)
+		self._script_jobs = []
+
+		if self._callback_ids:
+			om.MMessage.removeCallbacks(self._callback_ids)
+		self._callback_ids = []
+
+	def _on_network_node_changed(self, node, *args):
+		self._network_cache = None
+
+	def _invalidate_cache(self):
+		self._network_cache = None
+
+	def closeEvent(self, event):
+		self._sampler_worker.cancel()
+		self._remove_scene_callbacks()
+		super(ShaderToolWindow, self).closeEvent(event)
+
     # ---------------------------------------------------------------------------------------------------
     # Safely get attribute with fallback
     # ---------------------------------------------------------------------------------------------------
@@ -190,21 +433,36 @@ class ShaderToolWindow(QMainWindow):
 	# Gather all shader network node data
 	# ---------------------------------------------------------------------------------------------------
 	def get_network_node(self):
-		network_nodes = cmds.ls(type="network")
+		network_nodes = tuple(cmds.ls(type="network") or ())
+
+		# Same network nodes as last time, reuse the gathered data
+		if self._network_cache is not None and self._network_cache[0] == network_nodes:
+			return self._network_cache[1]
+
 		data = []
 
 		if network_nodes:
 			for node in network_nodes:
-				if not cmds.attributeQuery("referenceFilePath", node=node, exists=True):
+				# One listAttr per node instead of an objExists per attribute
+				attrs = set(cmds.listAttr(node, userDefined=True) or ())
+				if "referenceFilePath" not in attrs:
 					continue  # Not a shader metadata node
 
-				referenceFilePath   = self.safe_get_attr(node, "referenceFilePath")
-				referenceNode       = self.safe_get_attr(node, "referenceNode")
-				fileName            = self.safe_get_attr(node, "fileName")
-				referenceNamespace  = self.safe_get_attr(node, "referenceNamespace")
-				referenceType       = self.safe_get_attr(node, "referenceType")
-				referenceRevision   = self.safe_get_attr(node, "referenceRevision")
-				status              = self.safe_get_attr(node, "status", "False")
+				def get_attr(attr_name, default="N/A"):
+					if attr_name not in attrs:
+						return default
+					try:
+						return cmds.getAttr("%s.%s" % (node, attr_name))
+					except Exception:
+						return default
+
+				referenceFilePath   = get_attr("referenceFilePath")
+				referenceNode       = get_attr("referenceNode")
+				fileName            = get_attr("fileName")
+				referenceNamespace  = get_attr("referenceNamespace")
+				referenceType       = get_attr("referenceType")
+				referenceRevision   = get_attr("referenceRevision")
+				status              = get_attr("status", "False")
 
 				asset_type = self._extract_asset_type(referenceFilePath)
 
@@ -215,7 +473,8 @@ class ShaderToolWindow(QMainWindow):
 					"revision"       : referenceRevision,
 					"result"         : str(status),
 				})
-				
+
+		self._network_cache = (network_nodes, data)
 		return data
 
 	# ---------------------------------------------------------------------------------------------------
@@ -224,70 +483,17 @@ class ShaderToolWindow(QMainWindow):
 	def populate_table(self):
 		data = self.get_network_node()
 
-		self.table.clearContents()
-		self.table.setRowCount(0)
-		self.table.setColumnCount(5)
-
-		self.table.setHorizontalHeaderLabels([
-			"Reference_Path",
-			"Asset_Type",
-			"Assets_Name",
-			"Revision",
-			"Result"
-		])
-
 		filter_value = self.filterCombox.currentText()
+		rows = [dict(entry) for entry in data
+				if filter_value == "All Types" or filter_value == entry["asset_type"]]
 
-		row = 0
-		for entry in data:
-
-			# Apply filter
-			if filter_value != "All Types" and filter_value != entry["asset_type"]:
-				continue
-
-			self.table.insertRow(row)
-
-			# Column 0: Reference Path
-			item_path = QTableWidgetItem(entry["reference_path"])
-			item_path.setFont(QtGui.QFont("Arial", 10))
-			self.table.setItem(row, 0, item_path)
-
-			# Column 1: Asset Type
-			item_type = QTableWidgetItem(entry["asset_type"])
-			item_type.setFont(QtGui.QFont("Arial", 10))
-			item_type.setTextAlignment(QtCore.Qt.AlignCenter)
-			self.table.setItem(row, 1, item_type)
-
-			# Column 2: Asset Name
-			item_name = QTableWidgetItem(entry["assets_name"])
-			item_name.setFont(QtGui.QFont("Arial", 10))
-			item_name.setTextAlignment(QtCore.Qt.AlignCenter)
-			self.table.setItem(row, 2, item_name)
-
-			# Column 3: Revision
-			item_rev = QTableWidgetItem(entry["revision"])
-			item_rev.setFont(QtGui.QFont("Arial", 10))
-			item_rev.setTextAlignment(QtCore.Qt.AlignCenter)
-			self.table.setItem(row, 3, item_rev)
-
-			# Column 4: Result
-			item_result = QTableWidgetItem(entry["result"])
-			item_result.setFont(QtGui.QFont("Arial", 10))
-			item_result.setTextAlignment(QtCore.Qt.AlignCenter)
-			self.table.setItem(row, 4, item_result)
-
-			row += 1
-
-		# ----------------------------------------
-		# Header sizing (run once)
-		# ----------------------------------------
-		header = self.table.horizontalHeader()
-		self.REFERENCE_COLUMN_WIDTH = 750
-		self.table.setColumnWidth(0, self.REFERENCE_COLUMN_WIDTH)
-		header.setStretchLastSection(True)
-
-		for i in range(1, self.table.columnCount()):
-			header.setSectionResizeMode(i, QHeaderView.Stretch)
+		# One repaint after the reset instead of one per intermediate change
+		self.table.setUpdatesEnabled(False)
+		try:
+			self._model.set_rows(rows)
+		finally:
+			self.table.setUpdatesEnabled(True)
+		row = len(rows)
 
 		print("Loaded %d shader metadata references." % row)
 
@@ -296,29 +502,30 @@ class ShaderToolWindow(QMainWindow):
 	# ---------------------------------------------------------------------------------------------------
 	def _add_Asset_Type_filter(self):
 		"""Populate the asset type filter combo box."""
-		self.filterCombox.clear()
-		self.filterCombox.addItem("All Types")
-
-		asset_types = set()
-		network_nodes = cmds.ls(type="network")
-		for node in network_nodes:
-			if cmds.attributeQuery("referenceType", node=node, exists=True):
-				referenceType = self.safe_get_attr(node, "referenceType")
-				asset_types.add(referenceType)
-
-		for asset_type in sorted(asset_types):
-			self.filterCombox.addItem(asset_type)
+		# Reuse the (cached) network node data instead of querying each node again
+		asset_types = set(entry["asset_type"] for entry in self.get_network_node())
+
+		# Refill without firing populate_table for every clear/addItem, keeping the current filter when it still exists
+		current = self.filterCombox.currentText()
+		self.filterCombox.blockSignals(True)
+		try:
+			self.filterCombox.clear()
+			self.filterCombox.addItem("All Types")
+			for asset_type in sorted(asset_types):
+				self.filterCombox.addItem(asset_type)
+			self.filterCombox.setCurrentIndex(max(self.filterCombox.findText(current), 0))
+		finally:
+			self.filterCombox.blockSignals(False)
 	
 	# ---------------------------------------------------------------------------------------------------
 	# Helper methods
 	# ---------------------------------------------------------------------------------------------------
 	def _extract_asset_type(self, path):
 		"""Extract asset type from the path (char, set, prop)."""
-		parts = path.replace("\\", "/").lower().split("/")
-		for asset in ["character", "set", "setProp", "prop", "camera"]:
-			if asset in parts:
-				return asset
-			
+		for part in path.replace("\\", "/").lower().split("/"):
+			if part in _ASSET_TOKENS:
+				return _ASSET_CANONICAL.get(part, part)
+
 		return "unknown"
 
 	# ---------------------------------------------------------------------------------------------------
@@ -326,9 +533,8 @@ class ShaderToolWindow(QMainWindow):
 	# ---------------------------------------------------------------------------------------------------
 	def _extract_revision(self, path):
 		"""Extract revision (e.g., r0008) from the path."""
-		parts = path.replace("\\", "/").split("/")
-		for part in parts:
-			if part.lower().startswith("r") and part[1:].isdigit():
+		for part in path.replace("\\", "/").split("/"):
+			if _REV_RE.match(part):
 				return part
 		return "N/A"
 
@@ -338,12 +544,12 @@ class ShaderToolWindow(QMainWindow):
 	def generate_shader(self):
 		selected_only = self.checkbox.isChecked()
 		print("Generate Shader clicked. Selected only: {}".format(selected_only))
-		rows = self.get_selected_rows() if selected_only else range(self.table.rowCount())
+		rows = self.get_selected_rows() if selected_only else range(self._model.rowCount())
 
 		for row in rows:
-			asset_name = self.table.item(row, 2).text()
+			asset_name = self._model.row_data(row)["assets_name"]
 			print("Generating shader for: {}".format(asset_name))
-			self.table.setItem(row, 4, QTableWidgetItem("Generated"))
+			self._model.set_result(row, "Generated")
 
 		QMessageBox.information(self, "Shader Generation", "Shader generation completed.")
 
@@ -353,34 +559,15 @@ class ShaderToolWindow(QMainWindow):
 	def assign_shader(self, status=None):
 		"""Assign shader status to selected or all rows."""
 		selected_only = self.checkbox.isChecked()
-		rows = self.get_selected_rows() if selected_only else range(self.table.rowCount())
-
-		for row in rows:
-			asset_name = self.table.item(row, 2).text()
+		rows = self.get_selected_rows() if selected_only else range(self._model.rowCount())
 
-			# Determine status color and label
-			if status == "NA":
-				result_text = "NA"
-				bg_color = QtGui.QColor("#c62828")  # Red
-
-			elif status == "Shader-Generated":
-				result_text = "Shader-Generated"
-				bg_color = QtGui.QColor("#ff9800")  # Orange
-
-			elif status == "Assigned":
-				result_text = "Assigned"
-				bg_color = QtGui.QColor("#2e7d32")  # Green
-
-			else:
-				result_text = status or "Unknown"
-				bg_color = QtGui.QColor("#616161")  # Gray fallback
-
-			result_item = QTableWidgetItem(result_text)
-			result_item.setTextAlignment(QtCore.Qt.AlignCenter)
-			result_item.setBackground(bg_color)
-			result_item.setForeground(QtGui.QColor("#ffffff"))
-
-			self.table.setItem(row, 4, result_item)
+		# Colors come from the model's BackgroundRole
+		self.table.setUpdatesEnabled(False)
+		try:
+			for row in rows:
+				self._model.set_result(row, status or "Unknown")
+		finally:
+			self.table.setUpdatesEnabled(True)
 
 	# ---------------------------------------------------------------------------------------------------
 	# Get selected rows from the table
@@ -435,49 +622,60 @@ class ShaderToolWindow(QMainWindow):
 	# ---------------------------------------------------------------------------------------------------
 	def get_data_from_table(self):
 		"""Get data from the table as a list of dictionaries."""
-		data = []
-		for row in range(self.table.rowCount()):
-			item = {
-				"reference_path"	: self.table.item(row, 0).text(),
-				"asset_type"		: self.table.item(row, 1).text(),
-				"assets_name"		: self.table.item(row, 2).text(),
-				"revision"			: self.table.item(row, 3).text(),
-				"result"			: self.table.item(row, 4).text(),
-			}
-			data.append(item)
-
-		return data
+		return self._model.rows()
 	
 	# ---------------------------------------------------------------------------------------------------
 	# add result to table
 	# ---------------------------------------------------------------------------------------------------
 	def add_result_to_table(self):
 		"""Update result column with status color"""
-		data = self.get_data_from_table()
-
-		for row, entry in enumerate(data):
-			status = entry.get("result", "Unknown")
-
-			# ---- Default (fallback) ----
-			result_text = status
-			bg_color = QtGui.QColor("#616161")  # Gray (Unknown)
+		# Status colors are served by the model, just repaint the Result column
+		if self._model.rowCount():
+			self._model.dataChanged.emit(
+				self._model.index(0, ShaderRefModel.RESULT_COLUMN),
+				self._model.index(self._model.rowCount() - 1, ShaderRefModel.RESULT_COLUMN))
 
-			if status == "NA":
-				bg_color = QtGui.QColor("#c62828")  # Red
 
-			elif status == "Shader-Generated":
-				bg_color = QtGui.QColor("#ff9800")  # Orange
-
-			elif status == "Assigned":
-				bg_color = QtGui.QColor("#2e7d32")  # Green
-
-			result_item = QtWidgets.QTableWidgetItem(result_text)
-			result_item.setTextAlignment(QtCore.Qt.AlignCenter)
-			result_item.setBackground(bg_color)
-			result_item.setForeground(QtGui.QColor("#ffffff"))
+	# ---------------------------------------------------------------------------------------------------
+	# Collect (row, row_data) pairs from the selected rows, or all rows
+	# ---------------------------------------------------------------------------------------------------
+	def _collect_rows(self):
+		"""Return (row, row_data) pairs for the rows to process, None if the selection is empty."""
+		all_rows = self._model.rows()
+		if self.checkbox.isChecked():
+			rows = self.get_selected_rows()
+			if not rows:
+				QMessageBox.warning(self, "No Selection", "Please select at least one row.")
+				return None
+		else:
+			rows = xrange(len(all_rows))
 
-			self.table.setItem(row, 4, result_item)
+		# Handlers only read the row dicts, no per-row copy needed
+		return [(row, all_rows[row]) for row in rows]
 
+	# ---------------------------------------------------------------------------------------------------
+	# Reference path -> (reference node, namespace)
+	# ---------------------------------------------------------------------------------------------------
+	def _build_ref_map(self):
+		"""Map every top level reference path to its (reference node, namespace) in one pass."""
+		ref_map = {}
+		for ref_path in cmds.file(query=True, reference=True) or []:
+			try:
+				reference_node 	= cmds.referenceQuery(ref_path, referenceNode=True)
+				namespace 		= cmds.referenceQuery(reference_node, namespace=True)
+			except RuntimeError:
+				continue
+			ref_map[ref_path.replace("\\", "/")] = (reference_node, namespace)
+		return ref_map
+
+	def _lookup_reference(self, ref_map, reference_path):
+		"""Look up a row's reference, querying Maya only for paths missing from the map (nested refs)."""
+		reference_path = reference_path.replace("\\", "/")
+		if reference_path not in ref_map:
+			reference_node 	= cmds.file(reference_path, query=True, referenceNode=True)
+			namespace 		= cmds.referenceQuery(reference_node, namespace=True)
+			ref_map[reference_path] = (reference_node, namespace)
+		return ref_map[reference_path]
 
 	# ---------------------------------------------------------------------------------------------------
 	# Get selected table items as a list of dictionaries
@@ -485,43 +683,24 @@ class ShaderToolWindow(QMainWindow):
 	def get_selected_table_rows(self):
 		"""Get selected rows from the table and save to JSON if shaderInfo is missing."""
 
-		selected_only 	= self.checkbox.isChecked()
-		selected_data 	= []
 		json_data_list 	= []
 
 		# Get data from selected or all rows
-		if selected_only:
-			selected_indexes = self.table.selectionModel().selectedRows()
-			if not selected_indexes:
-				QMessageBox.warning(self, "No Selection", "Please select at least one row.")
-				return []
-			rows = [index.row() for index in selected_indexes]
-		else:
-			rows = range(self.table.rowCount())
+		selected_rows = self._collect_rows()
+		if selected_rows is None:
+			return []
 
-		# Extract data from rows
-		for row in rows:
-			row_data = {
-				"reference_path"	: self.table.item(row, 0).text(),
-				"asset_type"		: self.table.item(row, 1).text(),
-				"assets_name"		: self.table.item(row, 2).text(),
-				"revision"			: self.table.item(row, 3).text(),
-				"result"			: self.table.item(row, 4).text(),
-			}
-			selected_data.append(row_data)
+		ref_map = self._build_ref_map()
 
 		# Process each selected row
-		for data in selected_data:
+		for row, data in selected_rows:
 			if data["result"] == "True":
 				QMessageBox.information(self, "Result", "Shader Info exists for: {}".format(data["assets_name"]))
 			
 			else:
 				# Prepare JSON data
-				reference_path = data["reference_path"].replace("\\", "/")
-				# get reference node from the path
-				reference_node = cmds.file(reference_path, query=True, referenceNode=True)
-				# get namespace from the reference node
-				namespace = cmds.referenceQuery(reference_node, namespace=True)
+				# reference node / namespace from the map built once per click
+				reference_node, namespace = self._lookup_reference(ref_map, data["reference_path"])
 
 				json_data = {
 					"reference_path"	: data["reference_path"],
@@ -537,15 +716,13 @@ class ShaderToolWindow(QMainWindow):
 
 		# Save to JSON if there are items to generate
 		if json_data_list:
-			json_string = json.dumps(json_data_list, indent=4)
-
 			# Save to Maya's temp directory
 			temp_dir 	= cmds.internalVar(userTmpDir=True)
 			temp_file 	= os.path.join(temp_dir, "shaderGeneration.json")
 
 			try:
 				with open(temp_file, "w") as f:
-					f.write(json_string)
+					json.dump(json_data_list, f, indent=4)
 
 				# print("Shader info saved to:", temp_file)
 				# QMessageBox.information(self, "Success", "Shader info saved to:\n{}".format(temp_file))
@@ -559,7 +736,7 @@ class ShaderToolWindow(QMainWindow):
 	
 		self.pass_shader_generation_json() # Call the method to process the JSON file
 		# QMessageBox.information(self, "Shader Generation", "Shader generation completed for selected rows.")
-		return selected_data
+		return [data for _, data in selected_rows]
 	
 	# ---------------------------------------------------------------------------------------------------
 	# get the shaderGeneration.json file path
@@ -587,255 +764,297 @@ class ShaderToolWindow(QMainWindow):
 			QMessageBox.critical(self, "Invalid JSON", "Failed to load JSON from file:\n{}\n\nError: {}".format(temp_file, e))
 			return None
 
+	# ---------------------------------------------------------------------------------------------------
+	# ShaderPath folders
+	# ---------------------------------------------------------------------------------------------------
+	def _shader_root(self):
+		"""ShaderPath from the config with forward slashes, so asset paths can be joined with '/'."""
+		# load_config hands back the same dict until config.json changes on disk
+		config = load_config(config_path)
+		if config is not self.config:
+			self.config 		= config
+			self._shader_path 	= self._normalize_shader_path(config)
+		return self._shader_path
+
+	def _normalize_shader_path(self, config):
+		return config.get("ShaderPath", "").replace("\\", "/").rstrip("/")
+
+	def _asset_dir(self, shader_root, asset_type, assets_name, revision, create=False):
+		"""<ShaderPath>/<asset_type>/<assets_name>/<revision>, created at most once per session."""
+		asset_dir = "/".join((shader_root, asset_type, assets_name, revision))
+		if create and asset_dir not in self._mkdir_cache:
+			try:
+				os.makedirs(asset_dir)
+			except OSError:
+				if not os.path.isdir(asset_dir):
+					raise
+			self._mkdir_cache.add(asset_dir)
+		return asset_dir
+
+	# ---------------------------------------------------------------------------------------------------
+	# Write the <namespace>_shaderInfo.json status file, skipped when the content is unchanged
+	# ---------------------------------------------------------------------------------------------------
+	def _write_status_file(self, logs_path, data):
+		content = json.dumps(data, indent=4)
+		try:
+			with open(logs_path, "r") as f:
+				if f.read() == content:
+					return False
+		except IOError:
+			pass
+
+		with open(logs_path, "w") as f:
+			f.write(content)
+		return True
+
 	# ---------------------------------------------------------------------------------------------------
 	# pass the shaderGeneration.json file to udim_sampler
 	# ---------------------------------------------------------------------------------------------------
 	def pass_shader_generation_json(self):
 		"""Pass the shaderGeneration.json file to the UDIM sampler."""
 		data 			= self.get_shader_generation_json_path()
-		self.config 	= load_config(config_path)
-		texture_paths 	= self.config.get("ShaderPath", "")
+		texture_paths 	= self._shader_root()
 
 		if not data:
 			QMessageBox.warning(self, "No Data", "No data found in shaderGeneration.json.")
 			return
 
-		for item in data:
-			reference_path 	= item["reference_path"]
-			asset_type 		= item["asset_type"]
-			assets_name 	= item["assets_name"]
-			revision 		= item["revision"]
-			namespace 		= item["namespace"]
-			reference_node 	= item["reference_node"]
+		# An empty root would turn every asset folder into /<asset_type>/... at the filesystem root
+		if not texture_paths:
+			QMessageBox.warning(self, "Invalid Config", "ShaderPath is not set in config:\n{}".format(config_path))
+			return
+
+		# shaderInfo network nodes, listed once instead of an objExists per item
+		self._existing_nodes 	= set(cmds.ls("*_shaderInfo", type="network") or ())
+		self._sample_root 		= texture_paths
 
-			# Construct the texture path
-			# makeDir if not exists
-			if not os.path.exists(os.path.join(texture_paths, asset_type, assets_name, revision).replace("\\", "/")):
-				os.makedirs(os.path.join(texture_paths, asset_type, assets_name, revision).replace("\\", "/"))
+		# One asset per event loop turn, the window stays responsive between assets.
+		# Queued items refer to rows by reference_path, so nothing may repopulate the table or edit the scene meanwhile
+		self._set_actions_enabled(False)
+		self._sampler_worker.run(data)
 
-			texture_path = os.path.join(texture_paths, asset_type, 
-							   			assets_name, revision, "shaderInfo.json").replace("\\", "/")
+	# ---------------------------------------------------------------------------------------------------
+	# Sample one shaderGeneration.json item, returns the new status or None
+	# ---------------------------------------------------------------------------------------------------
+	def _sample_item(self, item):
+		asset_type 		= item["asset_type"]
+		assets_name 	= item["assets_name"]
+		revision 		= item["revision"]
+		namespace 		= item["namespace"]
+		reference_node 	= item["reference_node"]
+
+		# Construct the texture path
+		# makeDir if not exists
+		asset_dir 		= self._asset_dir(self._sample_root, asset_type, assets_name, revision, create=True)
+		texture_path 	= asset_dir + "/shaderInfo.json"
+
+		# Sample and save all meshes
+		sampler = udim_sampler.UDIMSampler()
+		result = sampler.sample_and_save_all_meshes(
+			sample_count		=5,
+			json_output_path	=texture_path,
+			reference_node		=reference_node,
+			namespace			=namespace
+		)
+
+		if not os.path.isfile(result):
+			return None
 
-			# Here you can call the UDIMSampler methods with the data
-			# For example, you can create an instance of UDIMSampler and call its methods
-			# Create an instance of UDIMSampler
-			sampler = udim_sampler.UDIMSampler()
+		namespace		= namespace.split(":")[1]
+		node_name  		= namespace + "_shaderInfo.json"
+		print(node_name)
+		logs_path 		= asset_dir + "/" + node_name
 
-			# Sample and save all meshes
-			try:
-				result = sampler.sample_and_save_all_meshes(
-					sample_count		=5,
-					json_output_path	=texture_path,
-					reference_node		=reference_node,
-					namespace			=namespace
-				)
-
-				if os.path.isfile(result):
-					namespace		= namespace.split(":")[1]
-					node_name  		= namespace + "_shaderInfo.json"
-					print(node_name)
-					logs_path = os.path.join(texture_paths, asset_type, 
-								assets_name, revision, node_name).replace("\\", "/")
-					
-					data = {
-						"namespace": "Shader-Generated"
-					}
-
-					with open(logs_path, "w") as f:
-						json.dump(data, f, indent=4)
-
-					node_name  = namespace + "_shaderInfo"
-					if cmds.objExists(node_name):
-						cmds.setAttr("%s.status" % node_name, "Shader-Generated", type="string")
-						self.assign_shader("Shader-Generated")
-
-			except Exception as e:
-				print("Error during UDIM sampling:", e)
+		self._write_status_file(logs_path, {"namespace": "Shader-Generated"})
+
+		node_name  = namespace + "_shaderInfo"
+		if node_name not in self._existing_nodes:
+			return None
+
+		cmds.setAttr("%s.status" % node_name, "Shader-Generated", type="string")
+		self._invalidate_cache()
+		return "Shader-Generated"
+
+	def _on_sample_progress(self, reference_path, status):
+		"""Update the Result cell of the row the sampled item came from."""
+		for row, entry in enumerate(self._model.rows()):
+			if entry["reference_path"] == reference_path:
+				self._model.set_result(row, status)
+
+	def _on_sample_finished(self):
+		self._set_actions_enabled(True)
+
+	def _set_actions_enabled(self, enabled):
+		for widget in (self.generate_button, self.assign_button, self.re_assign_button,
+					   self.sel_obj_re_assign_button, self.filterCombox, self._refresh_action):
+			widget.setEnabled(enabled)
+
+	# ---------------------------------------------------------------------------------------------------
+	# Summary dialog for a batch of rows
+	# ---------------------------------------------------------------------------------------------------
+	def _show_summary(self, title, sections):
+		"""Show one dialog listing asset names per (heading, names) section, a warning if anything failed."""
+		lines, has_failures = [], False
+		for index, (heading, names) in enumerate(sections):
+			if not names:
+				continue
+			has_failures = has_failures or index > 0
+			if lines:
+				lines.append("")
+			lines.append(heading)
+			lines.extend("  " + name for name in names)
+
+		if not lines:
+			return
+		if has_failures:
+			QMessageBox.warning(self, title, "\n".join(lines))
+		else:
+			QMessageBox.information(self, title, "\n".join(lines))
 
 	# ---------------------------------------------------------------------------------------------------
 	# assign shader to objects
 	# ---------------------------------------------------------------------------------------------------
 	def assign_shader_to_objects(self):
 		"""Assign shaders to objects based on the shaderGeneration.json file."""
-		selected_only 	= self.checkbox.isChecked()
-		selected_data 	= []
-
 		# Get data from selected or all rows
-		if selected_only:
-			selected_indexes = self.table.selectionModel().selectedRows()
-			if not selected_indexes:
-				QMessageBox.warning(self, "No Selection", "Please select at least one row.")
-				return []
-			rows = [index.row() for index in selected_indexes]
-		else:
-			rows = range(self.table.rowCount())
-
-		# Extract data from rows
-		for row in rows:
-			row_data = {
-				"reference_path"	: self.table.item(row, 0).text(),
-				"asset_type"		: self.table.item(row, 1).text(),
-				"assets_name"		: self.table.item(row, 2).text(),
-				"revision"			: self.table.item(row, 3).text(),
-				"result"			: self.table.item(row, 4).text(),
-			}
-			selected_data.append(row_data)
+		selected_rows = self._collect_rows()
+		if selected_rows is None:
+			return []
 
 		# Process each selected row
-		self.config 	= load_config(config_path)
-		texture_paths 	= self.config.get("ShaderPath", "")
+		texture_paths 	= self._shader_root()
+		ref_map 		= self._build_ref_map()
+		results 		= {"ok": [], "missing": []}
+		existing_nodes 	= set(cmds.ls("*_shaderInfo", type="network") or ())
 
-		for data in selected_data:
+		for row, data in selected_rows:
 			if data["result"] == "Shader-Generated":
 				# Generate the texture path
-				texture_path 	= os.path.join(texture_paths, data["asset_type"], 
-									data["assets_name"], data["revision"], "shaderInfo.json").replace("\\", "/")
+				asset_dir 		= self._asset_dir(texture_paths, data["asset_type"], data["assets_name"], data["revision"])
+				texture_path 	= asset_dir + "/shaderInfo.json"
 				
 				print("Assigning shader from:", texture_path)
 				
 				assigner 		= shader_assigner.ShaderAssigner()
 				assigner.process_json_and_assign_shaders(texture_path)
-				QMessageBox.information(self, "Result", "Shader assigned for: {}".format(data["assets_name"]))
+				results["ok"].append(data["assets_name"])
 
-				reference_path 	= data["reference_path"].replace("\\", "/")
-				# get reference node from the path
-				reference_node 	= cmds.file(reference_path, query=True, referenceNode=True)
-				# get namespace from the reference node
-				namespace 		= cmds.referenceQuery(reference_node, namespace=True)
+				# reference node / namespace from the map built once per click
+				reference_node, namespace = self._lookup_reference(ref_map, data["reference_path"])
 				namespace		= namespace.split(":")[1]
 				node_name  		= namespace + "_shaderInfo.json"
-				logs_path = os.path.join(texture_paths, data["asset_type"], 
-							data["assets_name"], data["revision"], node_name).replace("\\", "/")
+				logs_path 		= asset_dir + "/" + node_name
 				
 				data = {
 					"namespace": "Assigned"
 				}
 
-				with open(logs_path, "w") as f:
-					json.dump(data, f, indent=4)
+				self._write_status_file(logs_path, data)
 
 				node_name  = namespace + "_shaderInfo"
-				if cmds.objExists(node_name):
+				if node_name in existing_nodes:
 					cmds.setAttr("%s.status" % node_name, "Assigned", type="string")
-					self.assign_shader("Assigned")
+					self._invalidate_cache()
+					self._model.set_result(row, "Assigned")
 
 			else:
-				QMessageBox.warning(self, "Result", "Shader Info missing for: {}".format(data["assets_name"]))
+				results["missing"].append(data["assets_name"])
 				continue
 
 		# self.assign_shader("Assigned")  # Call the assign_shader method to update the UI
 
+		# One summary dialog instead of a modal per row
+		self._show_summary("Shader Assignment", [
+			("Shader assigned for:", results["ok"]),
+			("Shader Info missing for:", results["missing"]),
+		])
+
 	# ---------------------------------------------------------------------------------------------------
 	# re assign old shader
 	# --------------------------------------------------------------------------------------------------
 	def re_assign_old_shader(self):
 		"""Reassign old shaders to objects based on the shaderGeneration.json file."""
-		selected_only 	= self.checkbox.isChecked()
-		selected_data 	= []
-
 		# Get data from selected or all rows
-		if selected_only:
-			selected_indexes = self.table.selectionModel().selectedRows()
-			if not selected_indexes:
-				QMessageBox.warning(self, "No Selection", "Please select at least one row.")
-				return []
-			rows = [index.row() for index in selected_indexes]
-		else:
-			rows = range(self.table.rowCount())
-
-		# Extract data from rows
-		for row in rows:
-			row_data = {
-				"reference_path"	: self.table.item(row, 0).text(),
-				"asset_type"		: self.table.item(row, 1).text(),
-				"assets_name"		: self.table.item(row, 2).text(),
-				"revision"			: self.table.item(row, 3).text(),
-				"result"			: self.table.item(row, 4).text(),
-			}
-			selected_data.append(row_data)
+		selected_rows = self._collect_rows()
+		if selected_rows is None:
+			return []
 
 		# Process each selected row
-		self.config 	= load_config(config_path)
-		texture_paths 	= self.config.get("ShaderPath", "")
+		texture_paths 	= self._shader_root()
+		existing_nodes 	= set(cmds.ls("*_shaderInfo", type="network") or ())
+		results 		= {"ok": [], "failed": []}
 
-		for data in selected_data:
+		for row, data in selected_rows:
 			asset_type 		= (data.get("asset_type") or "").strip()
 			assets_name 	= (data.get("assets_name") or "").strip()
 			reference_path 	= (data.get("reference_path") or "").strip()
 			revision 		= (data.get("revision") or "").strip()
 			result 			= (data.get("result") or "").strip()
-			shaderPath 		= os.path.join(texture_paths, asset_type, assets_name, revision, "OlderShader.json").replace("\\", "/")
-			
-		if result == "Assigned":
+			shaderPath 		= self._asset_dir(texture_paths, asset_type, assets_name, revision) + "/OlderShader.json"
+
+			if result != "Assigned":
+				continue
+
 			# Reassign the old shader
 			re_assigner = shader_re_assigner.re_assigner_old(shaderPath)
-			
+
 			if re_assigner:
-				QMessageBox.information(self, "Result", "Shader Re-assignment Completed: {}".format(assets_name))
-				# update Result
-				self.table.item(row, 4).setText("Shader-Generated")
-				bg_color = QtGui.QColor("#ff9800")  # Orange
-				self.table.item(row, 4).setBackground(bg_color)
+				results["ok"].append(assets_name)
+				# update Result of this row only
+				self._model.set_result(row, "Shader-Generated")
 
 				# get network node update Status
 				# join name wEBAtriumA_shaderInfo
 				network_node = '_'.join([assets_name, "shaderInfo"])
-				if cmds.objExists(network_node):
+				if network_node in existing_nodes:
 					cmds.setAttr("%s.status" % network_node, "Shader-Generated", type="string")
-			
+					self._invalidate_cache()
+
 			else:
-				QMessageBox.warning(self, "Result", "Failed to reassign old shader for: {}".format(assets_name))
+				results["failed"].append(assets_name)
+
+		self._show_summary("Shader Re-assignment", [
+			("Shader Re-assignment Completed:", results["ok"]),
+			("Failed to reassign old shader for:", results["failed"]),
+		])
 
 	# ---------------------------------------------------------------------------------------------------
 	# assign shader to Selected objects
 	# ---------------------------------------------------------------------------------------------------
 	def assign_shader_to_Selected_objects(self):
 		"""Reassign old shaders to objects based on the shaderGeneration.json file."""
-		selected_only 	= self.checkbox.isChecked()
-		selected_data 	= []
-
 		# Get data from selected or all rows
-		if selected_only:
-			selected_indexes = self.table.selectionModel().selectedRows()
-			if not selected_indexes:
-				QMessageBox.warning(self, "No Selection", "Please select at least one row.")
-				return []
-			rows = [index.row() for index in selected_indexes]
-		else:
-			rows = range(self.table.rowCount())
-
-		# Extract data from rows
-		for row in rows:
-			row_data = {
-				"reference_path"	: self.table.item(row, 0).text(),
-				"asset_type"		: self.table.item(row, 1).text(),
-				"assets_name"		: self.table.item(row, 2).text(),
-				"revision"			: self.table.item(row, 3).text(),
-				"result"			: self.table.item(row, 4).text(),
-			}
-			selected_data.append(row_data)
+		selected_rows = self._collect_rows()
+		if selected_rows is None:
+			return []
 
 		# Process each selected row
-		self.config 	= load_config(config_path)
-		texture_paths 	= self.config.get("ShaderPath", "")
+		texture_paths 	= self._shader_root()
+		results 		= {"ok": [], "failed": []}
 
-		for data in selected_data:
+		for row, data in selected_rows:
 			asset_type 		= (data.get("asset_type") or "").strip()
 			assets_name 	= (data.get("assets_name") or "").strip()
 			reference_path 	= (data.get("reference_path") or "").strip()
 			revision 		= (data.get("revision") or "").strip()
 			result 			= (data.get("result") or "").strip()
-			shaderPath 		= os.path.join(texture_paths, asset_type, assets_name, revision, "OlderShader.json").replace("\\", "/")
-			
-		if result == "Assigned":
+			shaderPath 		= self._asset_dir(texture_paths, asset_type, assets_name, revision) + "/OlderShader.json"
+
+			if result != "Assigned":
+				continue
+
 			# Reassign the old shader
 			re_assigner = shader_re_assigner.Select_Object_ReAssigner(shaderPath)
-			
+
 			if re_assigner:
-				QMessageBox.information(self, "Result", "Shader Re-assignment Completed: {}".format(assets_name))
-			
+				results["ok"].append(assets_name)
 			else:
-				QMessageBox.warning(self, "Result", "Failed to reassign old shader for: {}".format(assets_name))
+				results["failed"].append(assets_name)
+
+		self._show_summary("Shader Re-assignment", [
+			("Shader Re-assignment Completed:", results["ok"]),
+			("Failed to reassign old shader for:", results["failed"]),
+		])
 
 
 # ====================================================================================================